@@ -26,8 +26,16 @@ Create a closed square grid
 import inspect
 import matplotlib.pyplot as plt
 import numpy as np
+import os
 import random
+import heapq
 import time
+from array import array
+from collections import deque
+from matplotlib.animation import PillowWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgb
+from matplotlib.figure import Figure
 
 """## CONSTANTS"""
 
@@ -63,6 +71,18 @@ GOAL_REACHED_FLAG = 1
 NO_MOVES_LEFT_FLAG = 2
 BOT_CAUGHT_FLAG = 3
 
+SEARCH_BFS = 0
+SEARCH_INCREMENTAL = 1
+SEARCH_DISTANCE_FIELD = 2
+SEARCH_BITBOARD = 3
+SEARCH_MEMORY_BOUNDED = 4
+
+INFINITY = float("inf")
+ALIEN_DANGER_RADIUS = 1 # farthest alien distance any Bot_4 risk check reads
+ALIEN_COUNTER_REBUILD_RATIO = 64
+BITBOARD_CHECKPOINT = 64
+TIMER_CHECK_INTERVAL = 64
+
 DEAD_CELLS_CONFIG = {
     'all_cells': 1,
     'half_cells': 2
@@ -112,6 +132,197 @@ def get_neighbors(row_size, column_size, cell, filter, grid):
 
     return neighbors
 
+"""
+    Returns all adjacent flattened cell indices (row * column_size + column),
+    in the same order as get_neighbors and without any filtering.
+"""
+
+
+def get_flat_neighbors(row_size, column_size, index):
+    row, col = divmod(index, column_size)
+    neighbors = []
+    if row + 1 < row_size:
+        neighbors.append(index + column_size)
+    if col + 1 < column_size:
+        neighbors.append(index + 1)
+    if col > 0:
+        neighbors.append(index - 1)
+    if row > 0:
+        neighbors.append(index - column_size)
+    return neighbors
+
+"""
+    Returns the adjacent flattened cell indices of every cell of a
+    row_size x column_size grid as a (row_size * column_size, 4) int32
+    matrix in get_neighbors order, row_size * column_size where the
+    neighbor is off the grid. The same for every layout of that size.
+"""
+
+
+def get_grid_neighbors(row_size, column_size):
+    total_cells = row_size * column_size
+    rows, cols = np.divmod(np.arange(total_cells, dtype=np.int32), column_size)
+    neighbors = np.empty((total_cells, 4), dtype=np.int32)
+    for i in range(4):
+        x_cord = rows + X_COORDINATE_SHIFT[i]
+        y_cord = cols + Y_COORDINATE_SHIFT[i]
+        in_bounds = (
+            (0 <= x_cord)
+            & (x_cord < row_size)
+            & (0 <= y_cord)
+            & (y_cord < column_size)
+        )
+        neighbors[:, i] = np.where(in_bounds, x_cord * column_size + y_cord, total_cells)
+    return neighbors
+
+"""
+    Returns the no of 4-neighbors of every cell that are set in the given
+    boolean matrix, computed with shifted slices of a zero padded copy.
+"""
+
+
+def count_adjacent(cell_mask):
+    padded = np.pad(cell_mask, 1).astype(np.int16)
+    return (
+        padded[2:, 1:-1] + padded[:-2, 1:-1] + padded[1:-1, 2:] + padded[1:-1, :-2]
+    )
+
+"""
+    Returns a boolean matrix of the cells that have at least one 4-neighbor
+    set in the given boolean matrix.
+"""
+
+
+def get_adjacent_cells(cell_mask):
+    padded = np.pad(cell_mask, 1)
+    return padded[2:, 1:-1] | padded[:-2, 1:-1] | padded[1:-1, 2:] | padded[1:-1, :-2]
+
+"""### ALIEN MOVE OVERLAY
+
+    Read only view of a grid where every cell an alien can move into next
+    turn reads as MOVED_ALIEN_CELL (open), MOVED_ALIEN_CAPTAIN_CELL (captain)
+    or BOT_CAUGHT_CELL (bot). The grid itself is never copied, the overlay
+    only keeps a boolean mask of the marked cells.
+"""
+
+class Alien_Move_Overlay:
+    def __init__(self, grid, marked_cells):
+        self.grid = grid
+        self.shape = grid.shape
+        is_alien = (grid & ALL_ALIEN_CELLS) != 0
+        self.alien_moves = get_adjacent_cells(is_alien) & ((grid & marked_cells) != 0)
+
+    def __getitem__(self, cell):
+        cell_value = self.grid[cell]
+        if not self.alien_moves[cell]:
+            return cell_value
+        if cell_value & OPEN_CELL:
+            return MOVED_ALIEN_CELL
+        if cell_value & CAPTAIN_CELL:
+            return MOVED_ALIEN_CAPTAIN_CELL
+        return BOT_CAUGHT_CELL
+
+    def filter_cells(self, neighbor_filter):
+        moved_filter = 0
+        if neighbor_filter & MOVED_ALIEN_CELL:
+            moved_filter |= OPEN_CELL
+        if neighbor_filter & MOVED_ALIEN_CAPTAIN_CELL:
+            moved_filter |= CAPTAIN_CELL
+        if neighbor_filter & BOT_CAUGHT_CELL:
+            moved_filter |= BOT_CELL
+
+        return np.where(
+            self.alien_moves,
+            (self.grid & moved_filter) != 0,
+            (self.grid & neighbor_filter) != 0,
+        )
+
+"""### CELL INDEX SET
+
+    Set of flattened cell indices (row * column_size + column) that supports
+    O(1) add, remove, membership and uniform random choice. Both tables are
+    C int arrays, 4 bytes per cell, so the set stays small on large ships.
+"""
+
+class CellIndexSet:
+
+    def __init__(self, capacity):
+        self.cells = array("i")
+        self.positions = array("i", [-1]) * capacity
+
+    @classmethod
+    def from_indices(cls, capacity, indices):
+        cell_set = cls(capacity)
+        indices = np.asarray(indices, dtype=np.int32)
+        cell_set.cells.frombytes(indices.tobytes())
+        np.frombuffer(cell_set.positions, dtype=np.int32)[indices] = np.arange(
+            len(indices), dtype=np.int32
+        )
+        return cell_set
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, index):
+        return self.positions[index] != -1
+
+    def add(self, index):
+        if self.positions[index] == -1:
+            self.positions[index] = len(self.cells)
+            self.cells.append(index)
+
+    def remove(self, index):
+        pos = self.positions[index]
+        if pos == -1:
+            return
+        last = self.cells.pop()
+        if last != index:
+            self.cells[pos] = last
+            self.positions[last] = pos
+        self.positions[index] = -1
+
+    def choice(self):
+        return random.choice(self.cells)
+
+"""### GRID CELL SET
+
+    CellIndexSet that takes and returns (row, col) cells, used in place of
+    the open, closed and player cell lists of large ships. Supports the
+    list methods the ship uses (append, remove, len, index and iteration),
+    so random.choice keeps working, but add and remove are O(1).
+"""
+
+class GridCellSet:
+    def __init__(self, column_size, cell_set):
+        self.column_size = column_size
+        self.cell_set = cell_set
+
+    @classmethod
+    def from_mask(cls, cell_mask):
+        return cls(
+            cell_mask.shape[1],
+            CellIndexSet.from_indices(cell_mask.size, np.flatnonzero(cell_mask)),
+        )
+
+    def __len__(self):
+        return len(self.cell_set)
+
+    def __getitem__(self, pos):
+        return divmod(self.cell_set.cells[pos], self.column_size)
+
+    def __iter__(self):
+        for index in self.cell_set.cells:
+            yield divmod(index, self.column_size)
+
+    def __contains__(self, cell):
+        return (cell[0] * self.column_size + cell[1]) in self.cell_set
+
+    def append(self, cell):
+        self.cell_set.add(cell[0] * self.column_size + cell[1])
+
+    def remove(self, cell):
+        self.cell_set.remove(cell[0] * self.column_size + cell[1])
+
 """### PLAYER PLACE AND COMMON METHODS"""
 
 class PlayerPlaceMethods:
@@ -147,6 +358,28 @@ class PlayerPlaceMethods:
         self.place_captain()
         self.place_aliens()
 
+    """
+        Places the players on the given flattened cells instead of random
+        ones, leaving the ship as place_players would have.
+    """
+
+    def load_players(self, bot_index, captain_index, alien_indices):
+        self.fetch_player_cells()
+        self.bot_cell = self.start = divmod(int(bot_index), self.column_size)
+        self.captain_cell = self.goal = divmod(int(captain_index), self.column_size)
+        self.grid[self.bot_cell] = BOT_CELL
+        self.grid[self.captain_cell] = CAPTAIN_CELL
+        self.player_cells.remove(self.bot_cell)
+        self.alien_cells = []
+        for alien_index in alien_indices:
+            alien_cell = divmod(int(alien_index), self.column_size)
+            if alien_cell == self.captain_cell:
+                self.grid[alien_cell] = CAPTAIN_ALIEN_CELL
+            else:
+                self.grid[alien_cell] = ALIEN_CELL
+            self.player_cells.remove(alien_cell)
+            self.alien_cells.append(alien_cell)
+
 class CommonShipMethods(PlayerPlaceMethods):
 
     def assign_base_cells(self):
@@ -166,19 +399,154 @@ class CommonShipMethods(PlayerPlaceMethods):
         self.open_cells.remove(cell)
 
     def fetch_cells_by_type(self, cell_type):
+        if self.large_grid:
+            return GridCellSet.from_mask(self.grid == cell_type)
         return list(zip(*np.where(self.grid == cell_type)))
 
     def show_grid(self):
         print(self.grid)
 
+"""### BITBOARD GRID
+
+    Bit-parallel view of a grid where every cell is one bit of a python int,
+    row by row, with an always clear padding bit at the end of each row so
+    that shifting by one never wraps into the next row.
+
+        bit(row, col) = 1 << (row * (column_size + 1) + col)
+
+    One BFS layer is a single shift-and-mask over the whole grid. Only every
+    BITBOARD_CHECKPOINT'th layer is kept and the layers in between are rebuilt
+    while walking the path back, so memory stays bounded on large ships.
+"""
+
+class Bitboard_Grid:
+    def __init__(self, row_size, column_size):
+        self.row_size = row_size
+        self.column_size = column_size
+        self.stride = column_size + 1
+        self.cell_boards = {}
+        self.nodes_expanded = 0 # cells reached by the last find_shortest_path
+
+    def from_mask(self, cell_mask):
+        padded = np.zeros((self.row_size, self.stride), dtype=bool)
+        padded[:, : self.column_size] = cell_mask
+        return int.from_bytes(
+            np.packbits(padded.reshape(-1), bitorder="little").tobytes(), "little"
+        )
+
+    """
+        Keeps one board per cell type present in the grid : {OPEN_CELL: 0b...}
+    """
+
+    def load_grid(self, grid):
+        self.cell_boards = {
+            int(cell_type): self.from_mask(grid == cell_type)
+            for cell_type in np.unique(grid)
+        }
+
+    def board(self, cell_filter):
+        board = 0
+        for cell_type, cell_board in self.cell_boards.items():
+            if cell_type & cell_filter:
+                board |= cell_board
+        return board
+
+    def cell_bit(self, cell):
+        return 1 << int(cell[0] * self.stride + cell[1])
+
+    def bit_cell(self, cell_bit):
+        return divmod(cell_bit.bit_length() - 1, self.stride)
+
+    def expand(self, board):
+        return (board << 1) | (board >> 1) | (board << self.stride) | (board >> self.stride)
+
+    """
+        Returns True if goal cell can be reached from start cell over the
+        passable cells (boolean matrix or board), one flood of bits per
+        layer, without keeping any of them.
+    """
+
+    def is_reachable(self, start_cell, goal_cell, passable):
+        if not isinstance(passable, int):
+            passable = self.from_mask(passable)
+        goal_bit = self.cell_bit(goal_cell)
+        frontier = self.cell_bit(start_cell)
+        unvisited = passable & ~frontier
+        while frontier and not (frontier & goal_bit):
+            frontier = self.expand(frontier) & unvisited
+            unvisited ^= frontier
+        return bool(frontier)
+
+    """
+        Returns the shortest path from start cell to goal cell over the
+        passable cells (boolean matrix or board), None if it is unreachable.
+    """
+
+    def find_shortest_path(self, start_cell, goal_cell, passable):
+        if not isinstance(passable, int):
+            passable = self.from_mask(passable)
+        goal_bit = self.cell_bit(goal_cell)
+        start_bit = self.cell_bit(start_cell)
+        if not passable & goal_bit:
+            return None
+
+        # checkpoints - [ (frontier, unvisited) every BITBOARD_CHECKPOINT layers ]
+        frontier = start_bit
+        unvisited = passable & ~start_bit
+        checkpoints = [(frontier, unvisited)]
+        distance = 0
+        while not frontier & goal_bit:
+            frontier = self.expand(frontier) & unvisited
+            if not frontier:
+                self.nodes_expanded = (passable & ~unvisited).bit_count()
+                return None
+            unvisited ^= frontier
+            distance += 1
+            if distance % BITBOARD_CHECKPOINT == 0:
+                checkpoints.append((frontier, unvisited))
+        self.nodes_expanded = (passable & ~unvisited).bit_count()
+
+        path = [goal_cell]
+        cell_bit = goal_bit
+        for block in range((distance - 1) // BITBOARD_CHECKPOINT, -1, -1):
+            frontier, unvisited = checkpoints[block]
+            layers = [frontier]
+            last_layer = min((block + 1) * BITBOARD_CHECKPOINT, distance) - 1
+            for _ in range(block * BITBOARD_CHECKPOINT, last_layer):
+                frontier = self.expand(frontier) & unvisited
+                unvisited ^= frontier
+                layers.append(frontier)
+
+            for layer in reversed(layers):
+                for neighbor_bit in (
+                    cell_bit << self.stride,
+                    cell_bit << 1,
+                    cell_bit >> 1,
+                    cell_bit >> self.stride,
+                ):
+                    if neighbor_bit & layer:
+                        break
+                cell_bit = neighbor_bit
+                path.append(self.bit_cell(cell_bit))
+
+        path.reverse()
+        return path
+
 """### PARENT SHIP"""
 
 class ParentShip(CommonShipMethods):
-    """ """
+    """
+    large_grid -
+        stores the grid as uint16, which holds every cell code, and keeps the
+        open, closed and player cells in GridCellSets instead of lists, so
+        memory stays flat and block/unblock stay O(1) on very large ships
+    """
 
-    def __init__(self, grid_size, no_of_aliens, *options):
+    def __init__(self, grid_size, no_of_aliens, *options, large_grid=False):
         self.grid_size = grid_size
         self.no_of_aliens = no_of_aliens
+        self.large_grid = large_grid
+        self.cell_dtype = np.uint16 if large_grid else int
         self.initialize_grid()
         self.row_size, self.column_size = self.grid.shape
         self.assign_base_cells()
@@ -186,11 +554,130 @@ class ParentShip(CommonShipMethods):
 
     def initialize_grid(self):
         """ """
-        self.grid = np.full((self.grid_size, self.grid_size), OPEN_CELL)
+        self.grid = np.full(
+            (self.grid_size, self.grid_size), OPEN_CELL, dtype=self.cell_dtype
+        )
 
     def generate_grid(self):
         """ """
 
+    """
+        Loads a layout of OPEN_CELL and CLOSED_CELL codes made by an earlier
+        generate_grid, in place of generating one.
+    """
+
+    def load_layout(self, layout):
+        self.grid = np.array(layout, dtype=self.cell_dtype)
+        self.row_size, self.column_size = self.grid.shape
+        self.assign_base_cells()
+        self.build_neighbor_tables()
+
+    """
+        Builds the neighbor table of the ship in CSR form over flattened cell
+        indices. Neighbors of cell i are
+            neighbor_indices[neighbor_offsets[i]:neighbor_offsets[i + 1]]
+        in get_neighbors order, closed cells have no neighbors and are never
+        listed as one. The layout never changes once generated, so this is
+        done once at the end of generate_grid.
+    """
+
+    def build_neighbor_tables(self):
+        total_cells = self.row_size * self.column_size
+        # off grid neighbors point at an extra cell that is never walkable
+        is_walkable = np.append((self.grid != CLOSED_CELL).reshape(-1), False)
+        neighbors = get_grid_neighbors(self.row_size, self.column_size)
+        is_neighbor = is_walkable[:total_cells, None] & is_walkable[neighbors]
+        self.neighbor_indices = neighbors[is_neighbor]
+        self.neighbor_offsets = np.zeros(total_cells + 1, dtype=np.int32)
+        np.cumsum(is_neighbor.sum(axis=1), out=self.neighbor_offsets[1:])
+        self.neighbor_lists = self.neighbor_rows = None
+
+    """
+        Returns the CSR neighbor table as C int arrays, (offsets, indices),
+        which is what the search and movement loops iterate over. Indexing
+        and slicing them yields plain ints like a list, at 4 bytes per entry.
+    """
+
+    def neighbor_tables(self):
+        if getattr(self, "neighbor_offsets", None) is None:
+            self.build_neighbor_tables()
+        if self.neighbor_lists is None:
+            self.neighbor_lists = (
+                array("i", self.neighbor_offsets.tobytes()),
+                array("i", self.neighbor_indices.tobytes()),
+            )
+        return self.neighbor_lists
+
+    """
+        Returns the neighbor table as a (row_size * column_size, 4) matrix,
+        missing neighbors are row_size * column_size. Lets the neighbors of
+        many cells be looked up in one array operation. int32 like the CSR
+        table, it is built once and shared by every bot on the ship.
+    """
+
+    def neighbor_matrix(self):
+        self.neighbor_tables()
+        if self.neighbor_rows is None:
+            total_cells = self.row_size * self.column_size
+            neighbor_counts = np.diff(self.neighbor_offsets)
+            self.neighbor_rows = np.full((total_cells, 4), total_cells, dtype=np.int32)
+            self.neighbor_rows[
+                np.repeat(np.arange(total_cells, dtype=np.int32), neighbor_counts),
+                np.arange(len(self.neighbor_indices), dtype=np.int32)
+                - np.repeat(self.neighbor_offsets[:-1], neighbor_counts),
+            ] = self.neighbor_indices
+        return self.neighbor_rows
+
+    """
+        Returns the int32 scratch array of move_aliens, one entry per
+        flattened cell index and one for missing neighbors. Bots never move
+        aliens at the same time and move_aliens resets every entry it reads,
+        so every bot on the ship shares this one.
+    """
+
+    def first_writers(self):
+        if getattr(self, "first_writer_cells", None) is None:
+            self.first_writer_cells = np.zeros(
+                self.row_size * self.column_size + 1, dtype=np.int32
+            )
+        return self.first_writer_cells
+
+    def bitboard_grid(self):
+        if getattr(self, "bitboards", None) is None:
+            self.bitboards = Bitboard_Grid(self.row_size, self.column_size)
+            self.bitboards.load_grid(self.grid)
+        return self.bitboards
+
+    """
+        Returns the BFS distance of every flattened cell index from the
+        captain cell over all non closed cells, -1 for unreachable cells.
+        The layout never changes after generation, so the field is computed
+        once per ship and shared by every bot searching it.
+    """
+
+    def captain_distance_field(self):
+        if getattr(self, "distance_field_goal", None) == self.goal:
+            return self.distance_field
+
+        neighbor_offsets, neighbor_indices = self.neighbor_tables()
+        distance_field = array("i", [-1]) * (self.row_size * self.column_size)
+        goal_index = self.goal[0] * self.column_size + self.goal[1]
+        distance_field[goal_index] = 0
+        bfs_queue = deque([goal_index])
+
+        while bfs_queue:
+            cell = bfs_queue.popleft()
+            for neighbor in neighbor_indices[
+                neighbor_offsets[cell] : neighbor_offsets[cell + 1]
+            ]:
+                if distance_field[neighbor] == -1:
+                    distance_field[neighbor] = distance_field[cell] + 1
+                    bfs_queue.append(neighbor)
+
+        self.distance_field = distance_field
+        self.distance_field_goal = self.goal
+        return distance_field
+
 """### NORMAL SHIP"""
 
 class Ship(ParentShip):
@@ -202,75 +689,113 @@ class Ship(ParentShip):
 
     static_var = 0
 
-    def __init__(self, grid_size, no_of_aliens):
-        super(Ship, self).__init__(grid_size, no_of_aliens)
+    def __init__(self, grid_size, no_of_aliens, large_grid=False):
+        super(Ship, self).__init__(grid_size, no_of_aliens, large_grid=large_grid)
         self.x_start = self.y_start = None
 
     ### GRID GENERATION METHODS ###
 
     def initialize_grid(self):
-        self.grid = np.full((self.grid_size, self.grid_size), CLOSED_CELL)
+        self.grid = np.full(
+            (self.grid_size, self.grid_size), CLOSED_CELL, dtype=self.cell_dtype
+        )
 
     def dead_cells_config(self):
         return DEAD_CELLS_CONFIG['half_cells']
 
     def generate_grid(self):
         self.assign_start_cell()
+        self.init_frontier()
         self.unblock_closed_cells()
         self.unblock_dead_ends()
+        self.clear_frontier()
+        self.build_neighbor_tables()
 
     def assign_start_cell(self):
         self.x_start = random.randint(0, self.grid_size - 1)
         self.y_start = random.randint(0, self.grid_size - 1)
         self.unblock_cell((self.x_start, self.y_start))
 
-    def unblock_closed_cells(self):
-        available_cells = self.cells_with_one_open_neighbor(self.closed_cells)
-        while available_cells:
-            closed_cell = random.choice(available_cells)
-            self.unblock_cell(closed_cell)
-            available_cells = self.cells_with_one_open_neighbor(self.closed_cells)
+    """
+        Builds the live generation state over flattened cell indices.
 
-    def unblock_dead_ends(self):
-        dead_end_cells = self.cells_with_one_open_neighbor(self.open_cells)
-        half_len = len(dead_end_cells) // self.dead_cells_config()
+        frontier_cells - closed cells with exactly one open neighbor
+        dead_end_cells - open cells with exactly one open neighbor
+        open_neighbor_count - no of open neighbors of every cell
+        is_open - open flag of every cell, written back to grid at the end
 
-        while half_len:
+        Opening a cell only changes the counts of its four neighbors, so both
+        sets are kept up to date in O(1) per opened cell instead of rescanning
+        the whole grid on every iteration.
+    """
 
-            dead_end_cells = self.cells_with_one_open_neighbor(self.open_cells)
-            half_len -= 1
-            if len(dead_end_cells) == 0: continue
-            dead_end_cell = random.choice(dead_end_cells)
-            closed_neighbors = get_neighbors(
-                self.row_size, self.column_size, dead_end_cell, CLOSED_CELL, self.grid
+    def init_frontier(self):
+        total_cells = self.row_size * self.column_size
+        self.is_open = bytearray(total_cells)
+        self.open_neighbor_count = bytearray(total_cells)
+        self.frontier_cells = CellIndexSet(total_cells)
+        self.dead_end_cells = CellIndexSet(total_cells)
+        for cell in self.open_cells:
+            self.mark_open(cell[0] * self.column_size + cell[1])
+
+    def clear_frontier(self):
+        open_indices = np.frombuffer(self.is_open, dtype=np.uint8).nonzero()[0]
+        self.grid.reshape(-1)[open_indices] = OPEN_CELL
+        self.open_cells = self.fetch_cells_by_type(OPEN_CELL)
+        self.closed_cells = self.fetch_cells_by_type(CLOSED_CELL)
+        self.is_open = self.open_neighbor_count = None
+        self.frontier_cells = self.dead_end_cells = None
+
+    def mark_open(self, index):
+        self.is_open[index] = 1
+        self.frontier_cells.remove(index)
+        if self.open_neighbor_count[index] == 1:
+            self.dead_end_cells.add(index)
+
+        for neighbor in get_flat_neighbors(self.row_size, self.column_size, index):
+            self.open_neighbor_count[neighbor] += 1
+            open_count = self.open_neighbor_count[neighbor]
+            cell_set = (
+                self.dead_end_cells if self.is_open[neighbor] else self.frontier_cells
             )
+            if open_count == 1:
+                cell_set.add(neighbor)
+            elif open_count == 2:
+                cell_set.remove(neighbor)
 
-            random_cell = random.choice(closed_neighbors)
-            self.unblock_cell(random_cell)
+    def unblock_closed_cells(self):
+        while self.frontier_cells:
+            self.mark_open(self.frontier_cells.choice())
+
+    def unblock_dead_ends(self):
+        half_len = len(self.dead_end_cells) // self.dead_cells_config()
 
-    def cells_with_one_open_neighbor(self, cells):
-        results = []
-        for cell in cells:
-            no_of_open_neighbors = len(
-                get_neighbors(
-                    self.row_size, self.column_size, cell, OPEN_CELL, self.grid
+        while half_len:
+            half_len -= 1
+            if len(self.dead_end_cells) == 0: continue
+            dead_end_cell = self.dead_end_cells.choice()
+            closed_neighbors = [
+                neighbor
+                for neighbor in get_flat_neighbors(
+                    self.row_size, self.column_size, dead_end_cell
                 )
-            )
-            if no_of_open_neighbors == 1:
-                results.append((cell[0], cell[1]))
-        return results
+                if not self.is_open[neighbor]
+            ]
+
+            self.mark_open(random.choice(closed_neighbors))
 
 """### BONUS SHIPS"""
 
 class BonusShipV1(ParentShip):
 
-    def __init__(self, grid_size, no_of_aliens):
-        super(BonusShipV1, self).__init__(grid_size, no_of_aliens)
+    def __init__(self, grid_size, no_of_aliens, large_grid=False):
+        super(BonusShipV1, self).__init__(grid_size, no_of_aliens, large_grid=large_grid)
 
     ### GRID GENERATION METHODS ###
 
     def generate_grid(self):
         self.block_alternate_cells()
+        self.build_neighbor_tables()
 
     def block_alternate_cells(self):
         alternate_cells = [
@@ -284,72 +809,97 @@ class BonusShipV1(ParentShip):
 
 class BonusShipV2(Ship):
 
-    def __init__(self, grid_size, no_of_aliens):
-        super(BonusShipV2, self).__init__(grid_size, no_of_aliens)
+    def __init__(self, grid_size, no_of_aliens, large_grid=False):
+        super(BonusShipV2, self).__init__(grid_size, no_of_aliens, large_grid=large_grid)
 
     def dead_cells_config(self):
         return DEAD_CELLS_CONFIG['all_cells']
 
-"""## VISUALIZING THE GRID"""
+"""## VISUALIZING THE GRID
 
-def show_color_grid(grid):
-    color_map = {
-        CLOSED_CELL: "black",
-        OPEN_CELL: "white",
-        BOT_CELL: "blue",
-        CAPTAIN_CELL: "green",
-        ALIEN_CELL: "red",
-        BOT_CAUGHT_CELL: "cyan",
-        CAPTAIN_ALIEN_CELL: "magenta",
-        BOT_SUCCESS_CELL: "yellow",
-        MOVED_ALIEN_CELL: "red",
-    }
+    Every cell code is mapped to its color through GRID_COLOR_LUT, a table
+    of RGB rows indexed by cell code, so a whole grid becomes an image in
+    one indexing operation and is drawn with a single imshow. The export
+    functions only use Figure and the Agg canvas, never pyplot windows, so
+    they also run headless inside pool workers.
+"""
 
-    # Create the figure and axes
-    fig, ax = plt.subplots()
+GRID_COLORS = {
+    CLOSED_CELL: "black",
+    OPEN_CELL: "white",
+    BOT_CELL: "blue",
+    CAPTAIN_CELL: "green",
+    ALIEN_CELL: "red",
+    BOT_CAUGHT_CELL: "cyan",
+    CAPTAIN_ALIEN_CELL: "magenta",
+    BOT_SUCCESS_CELL: "yellow",
+    MOVED_ALIEN_CELL: "red",
+    MOVED_ALIEN_CAPTAIN_CELL: "magenta",
+}
+GRID_COLOR_LUT = np.zeros((MOVED_ALIEN_CAPTAIN_CELL + 1, 3), dtype=np.uint8)
+for cell_type, color in GRID_COLORS.items():
+    GRID_COLOR_LUT[cell_type] = np.round(np.array(to_rgb(color)) * 255)
+GRID_IMAGE_SCALE = 8 # pixels per cell side of exported frames
 
-    # Define cell width and height
-    cell_width = 1
-    cell_height = 1
+def grid_to_rgb(grid, scale=1):
+    rgb = GRID_COLOR_LUT[grid]
+    if scale > 1:
+        rgb = rgb.repeat(scale, axis=0).repeat(scale, axis=1)
+    return rgb
 
-    row_size, col_size = grid.shape
+"""
+    Draws the grid on ax with black cell borders and returns the image, whose
+    set_data takes the grid_to_rgb of the next frame.
+"""
 
-    # Fill the cells with the "x" pattern
-    for i in range(row_size):
-        for j in range(col_size):
-            color = color_map[grid[i][j]]
-            x = j * cell_width
-            y = (row_size - i - 1) * cell_height
-            ax.plot(
-                [x, x + cell_width, x + cell_width, x],
-                [y, y + cell_height, y, y + cell_height],
-                color=color,
-                linewidth=2,
-            )
+def draw_color_grid(ax, grid):
+    row_size, col_size = grid.shape
+    image = ax.imshow(grid_to_rgb(grid), interpolation="nearest")
+    ax.set_xticks(np.arange(-0.5, col_size), minor=True)
+    ax.set_yticks(np.arange(-0.5, row_size), minor=True)
+    ax.grid(which="minor", color="black", linewidth=1)
+    ax.tick_params(which="both", length=0, labelbottom=False, labelleft=False)
+    return image
 
-    # Draw black borders around each cell
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            ax.plot([j, j + 1], [i, i], color="black", linewidth=1)
-            ax.plot([j, j + 1], [i + 1, i + 1], color="black", linewidth=1)
-            ax.plot([j, j], [i, i + 1], color="black", linewidth=1)
-            ax.plot([j + 1, j + 1], [i, i + 1], color="black", linewidth=1)
-
-    # Set limits and labels
-    ax.set_xlim(0, col_size * cell_width)
-    ax.set_ylim(0, row_size * cell_height)
-    ax.set_aspect("equal")
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.set_xlabel("X")
-    ax.set_ylabel("Y")
-
-    # Turn off axes
-    ax.axis("off")
-
-    # Show the plot
+def show_color_grid(grid):
+    fig, ax = plt.subplots()
+    draw_color_grid(ax, grid)
     plt.show()
 
+def save_color_grid(grid, path, scale=GRID_IMAGE_SCALE):
+    plt.imsave(path, grid_to_rgb(grid, scale))
+
+"""
+    Writes every grid of grids, e.g. the turns of a Trace_Replayer episode,
+    to frame_dir as turn_<no>.png, returns the paths.
+"""
+
+def export_grid_frames(grids, frame_dir, scale=GRID_IMAGE_SCALE):
+    os.makedirs(frame_dir, exist_ok=True)
+    frame_paths = []
+    for turn, grid in enumerate(grids):
+        frame_path = os.path.join(frame_dir, f"turn_{turn:05d}.png")
+        save_color_grid(grid, frame_path, scale)
+        frame_paths.append(frame_path)
+    return frame_paths
+
+"""
+    Writes grids as one animated gif at fps frames per second.
+"""
+
+def export_grid_animation(grids, path, fps=4, dpi=100):
+    grids = iter(grids)
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    image = draw_color_grid(ax, next(grids))
+    writer = PillowWriter(fps=fps)
+    with writer.saving(figure, path, dpi):
+        writer.grab_frame()
+        for grid in grids:
+            image.set_data(grid_to_rgb(grid))
+            writer.grab_frame()
+
 """## CONSTRAINTS"""
 
 class Constraints:
@@ -359,11 +909,361 @@ class Constraints:
         bot_max_moves=1000,
         max_search_time=-1,
         reduce_search_frequenzy=False,
+        search_mode=SEARCH_BFS,
+        reachability_oracle=False,
+        max_move_time=-1,
+        space_time_horizon=-1,
     ):
         self.queue_size = queue_size
         self.bot_max_moves = bot_max_moves
         self.reduce_search_frequenzy = reduce_search_frequenzy
         self.max_search_time = max_search_time
+        self.search_mode = search_mode
+        self.reachability_oracle = reachability_oracle
+        self.max_move_time = max_move_time
+        self.space_time_horizon = space_time_horizon
+
+"""## INCREMENTAL PLANNER
+
+    D* Lite over flattened cell indices. The search runs backwards from the
+    captain, so the g/rhs values stay valid while the bot moves and only the
+    cells whose passability changed since the last call (aliens entering or
+    leaving, the bot moving) are repaired.
+"""
+
+class Incremental_Planner:
+    def __init__(self, row_size, column_size, goal_cell, neighbor_tables):
+        self.row_size = row_size
+        self.column_size = column_size
+        self.neighbor_offsets, self.neighbor_indices = neighbor_tables
+        total_cells = row_size * column_size
+        self.goal = goal_cell[0] * column_size + goal_cell[1]
+        self.g = [INFINITY] * total_cells
+        self.rhs = [INFINITY] * total_cells
+        self.passable = bytearray(total_cells)
+        self.passable_view = np.frombuffer(self.passable, dtype=np.uint8)
+        self.open_heap = []
+        self.open_keys = {}
+        self.key_modifier = 0
+        self.start = self.last_start = None
+        self.nodes_expanded = 0
+
+    def heuristic(self, cell_1, cell_2):
+        row_1, col_1 = divmod(cell_1, self.column_size)
+        row_2, col_2 = divmod(cell_2, self.column_size)
+        return abs(row_1 - row_2) + abs(col_1 - col_2)
+
+    def neighbors(self, cell):
+        return self.neighbor_indices[
+            self.neighbor_offsets[cell] : self.neighbor_offsets[cell + 1]
+        ]
+
+    def calculate_key(self, cell):
+        min_cost = min(self.g[cell], self.rhs[cell])
+        return (
+            min_cost + self.heuristic(self.start, cell) + self.key_modifier,
+            min_cost,
+        )
+
+    def top_key(self):
+        while self.open_heap:
+            key, cell = self.open_heap[0]
+            if self.open_keys.get(cell) == key:
+                return key
+            heapq.heappop(self.open_heap)
+        return (INFINITY, INFINITY)
+
+    def update_vertex(self, cell):
+        if not self.passable[cell]:
+            self.rhs[cell] = INFINITY
+        elif cell == self.goal:
+            self.rhs[cell] = 0
+        else:
+            self.rhs[cell] = min(
+                (
+                    self.g[neighbor] + 1
+                    for neighbor in self.neighbors(cell)
+                    if self.passable[neighbor]
+                ),
+                default=INFINITY,
+            )
+
+        if self.g[cell] != self.rhs[cell]:
+            key = self.calculate_key(cell)
+            self.open_keys[cell] = key
+            heapq.heappush(self.open_heap, (key, cell))
+        else:
+            self.open_keys.pop(cell, None)
+
+    def compute_shortest_path(self):
+        while True:
+            top_key = self.top_key()
+            if not (
+                top_key < self.calculate_key(self.start)
+                or self.rhs[self.start] != self.g[self.start]
+            ) or not self.open_heap:
+                break
+
+            cell = heapq.heappop(self.open_heap)[1]
+            del self.open_keys[cell]
+            self.nodes_expanded += 1
+            new_key = self.calculate_key(cell)
+            if top_key < new_key:
+                self.open_keys[cell] = new_key
+                heapq.heappush(self.open_heap, (new_key, cell))
+            elif self.g[cell] > self.rhs[cell]:
+                self.g[cell] = self.rhs[cell]
+                for neighbor in self.neighbors(cell):
+                    self.update_vertex(neighbor)
+            else:
+                self.g[cell] = INFINITY
+                self.update_vertex(cell)
+                for neighbor in self.neighbors(cell):
+                    self.update_vertex(neighbor)
+
+    def update_cells(self, passable):
+        passable = passable.reshape(-1).astype(np.uint8)
+        changed_cells = np.flatnonzero(self.passable_view != passable)
+        self.passable_view[changed_cells] = passable[changed_cells]
+        for cell in changed_cells.tolist():
+            self.update_vertex(cell)
+            for neighbor in self.neighbors(cell):
+                self.update_vertex(neighbor)
+
+    """
+        Repairs the search for the new bot cell and passable mask, and returns
+        the shortest path from bot cell to captain cell or None if the captain
+        cannot be reached.
+
+        Parameters
+        ----------
+            start_cell - list
+                current bot cell : (0, 0)
+            passable - numpy bool matrix array
+                true for every cell the bot can move into
+    """
+
+    def find_path(self, start_cell, passable):
+        self.start = start_cell[0] * self.column_size + start_cell[1]
+        if self.last_start is None:
+            self.last_start = self.start
+        elif self.start != self.last_start:
+            self.key_modifier += self.heuristic(self.last_start, self.start)
+            self.last_start = self.start
+
+        self.update_cells(passable)
+        self.compute_shortest_path()
+
+        if self.g[self.start] == INFINITY:
+            return None
+
+        cell = self.start
+        path = [divmod(cell, self.column_size)]
+        while cell != self.goal:
+            next_cell = min(
+                (
+                    neighbor
+                    for neighbor in self.neighbors(cell)
+                    if self.passable[neighbor]
+                ),
+                key=lambda neighbor: self.g[neighbor],
+                default=cell,
+            )
+            if self.g[next_cell] >= self.g[cell]:
+                return None
+            cell = next_cell
+            path.append(divmod(cell, self.column_size))
+
+        return path
+
+"""## REACHABILITY ORACLE
+
+    Union-find over the flattened cell indices of the passable cells, kept
+    up to date across turns from the grid cells the bot writes. Only the
+    cells written since the last query are checked, so a query costs
+    O(cells written) in place of a pass over the whole mask.
+
+    A freed cell is joined with its passable neighbors. A blocked cell cannot
+    be split out of its component, so the components only ever merge more
+    than they should: different components always mean the captain cannot
+    be reached, while the same component is only exact until the first cell
+    gets blocked. The components are rebuilt from scratch when a search the
+    oracle let through comes back empty, so the turns after it are answered
+    without searching.
+"""
+
+class Reachability_Oracle:
+    def __init__(self, row_size, column_size, neighbor_tables):
+        self.column_size = column_size
+        self.neighbor_offsets, self.neighbor_indices = neighbor_tables
+        self.total_cells = row_size * column_size
+        self.parent = array("i", range(self.total_cells))
+        self.passable = bytearray(self.total_cells)
+        self.passable_view = np.frombuffer(self.passable, dtype=np.uint8)
+        self.is_exact = True
+        # flattened indices of the grid cells written since the last query
+        self.changed_cells = []
+
+        # edges - every pair of neighboring cells once, lower index first
+        neighbor_offsets = np.asarray(self.neighbor_offsets, dtype=np.int32)
+        edge_end = np.asarray(self.neighbor_indices, dtype=np.int32)
+        edge_start = np.repeat(
+            np.arange(self.total_cells, dtype=np.int32), np.diff(neighbor_offsets)
+        )
+        is_forward = edge_start < edge_end
+        self.edge_start = edge_start[is_forward]
+        self.edge_end = edge_end[is_forward]
+
+    def find(self, cell):
+        parent = self.parent
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    def join_neighbors(self, cell):
+        for neighbor in self.neighbor_indices[
+            self.neighbor_offsets[cell] : self.neighbor_offsets[cell + 1]
+        ]:
+            if self.passable[neighbor]:
+                root_1 = self.find(cell)
+                root_2 = self.find(neighbor)
+                if root_1 != root_2:
+                    self.parent[root_1] = root_2
+
+    """
+        Recomputes the components of the current passable mask with whole
+        array passes. Every round hooks each component onto the smallest
+        neighboring root and then flattens the labels, so the no of
+        components at least halves per round.
+    """
+
+    def rebuild(self):
+        is_edge = (self.passable_view[self.edge_start] & self.passable_view[self.edge_end]) != 0
+        edge_start = self.edge_start[is_edge]
+        edge_end = self.edge_end[is_edge]
+        labels = np.arange(self.total_cells, dtype=np.int32)
+        while True:
+            start_labels = labels[edge_start]
+            end_labels = labels[edge_end]
+            is_split = start_labels != end_labels
+            if not is_split.any():
+                break
+            np.minimum.at(
+                labels,
+                np.maximum(start_labels[is_split], end_labels[is_split]),
+                np.minimum(start_labels[is_split], end_labels[is_split]),
+            )
+            while True:
+                root_labels = labels[labels]
+                if (root_labels == labels).all():
+                    break
+                labels = root_labels
+
+        self.parent = array("i", labels.tobytes())
+        self.is_exact = True
+
+    def update_cells(self, cells, passable_cells):
+        for cell, is_passable in zip(cells, passable_cells):
+            if self.passable[cell] == is_passable:
+                continue
+            self.passable[cell] = is_passable
+            if is_passable:
+                self.join_neighbors(cell)
+            else:
+                self.is_exact = False
+
+    """
+        Returns False if the goal cell can never be reached from the start
+        cell over the passable cells, True if it can and None if the
+        components went stale and only a search can tell. The changed cells
+        must be applied with update_cells first.
+
+        Parameters
+        ----------
+            start_cell - list
+                current bot cell : (0, 0)
+            goal_cell - list
+                captain cell : (5, 5)
+    """
+
+    def is_reachable(self, start_cell, goal_cell):
+        start = start_cell[0] * self.column_size + start_cell[1]
+        goal = goal_cell[0] * self.column_size + goal_cell[1]
+        if not self.passable[goal] or self.find(start) != self.find(goal):
+            return False
+        return True if self.is_exact else None
+
+"""### EVENT TRACER
+
+    Ring buffer of debug events, filled by the search loops, escape helpers
+    and alien moves in place of printing. Every call site is guarded by
+    `tracer is not None`, so without a tracer no argument is built at all.
+    Bots get one at LOG_DEBUG and print it at the end of the episode, and
+    one can be set on any other bot to read its events afterwards.
+
+    An event is its TRACE_* code and three ints, cells as flattened
+    indices, kept in a C int array of TRACE_CAPACITY events. It is only
+    turned into text by format_events.
+"""
+
+TRACE_CAPACITY = 1 << 16
+TRACE_NODE = 1
+TRACE_PATH = 2
+TRACE_CUT_SHORT_PATH = 3
+TRACE_UNREACHABLE = 4
+TRACE_ESCAPE = 5
+TRACE_ALIEN_MOVE = 6
+TRACE_ALIEN_STUCK = 7
+TRACE_ALIEN_CATCH = 8
+
+# { event: (format, which of the three args are cells) }
+TRACE_FORMATS = {
+    TRACE_NODE: ("current_cell {0} path_length {1}", (True, False, False)),
+    TRACE_PATH: ("Iterations Completed : {0}\tPath Length : {1}", (False, False, False)),
+    TRACE_CUT_SHORT_PATH: ("Iterations Completed : {0}\tPath Length : {1}\tCut Short", (False, False, False)),
+    TRACE_UNREACHABLE: ("Iterations Completed : {0}\tCaptain unreachable", (False, False, False)),
+    TRACE_ESCAPE: ("Iterations Completed : {0}\tEscape Path : [{1}, {2}]", (False, True, True)),
+    TRACE_ALIEN_MOVE: ("Alien {0} moves from {1} to {2}", (False, True, True)),
+    TRACE_ALIEN_STUCK: ("Alien {0} at {1} has no moves", (False, True, False)),
+    TRACE_ALIEN_CATCH: ("Alien {0} moves from {1} to bot cell {2}", (False, True, True)),
+}
+
+class Event_Tracer:
+    def __init__(self, capacity=TRACE_CAPACITY):
+        self.capacity = capacity
+        self.events = array("i", [0]) * (capacity * 4)
+        self.count = 0
+
+    def record(self, event, arg_1=0, arg_2=0, arg_3=0):
+        pos = (self.count % self.capacity) * 4
+        events = self.events
+        events[pos] = event
+        events[pos + 1] = arg_1
+        events[pos + 2] = arg_2
+        events[pos + 3] = arg_3
+        self.count += 1
+
+    """
+        Returns the events still in the buffer, oldest first, as a
+        (events, 4) int32 matrix of (event, arg_1, arg_2, arg_3).
+    """
+
+    def to_numpy(self):
+        events = np.frombuffer(self.events, dtype=np.int32).reshape(-1, 4)
+        if self.count <= self.capacity:
+            return events[: self.count].copy()
+        return np.roll(events, -(self.count % self.capacity), axis=0)
+
+    def format_events(self, column_size):
+        lines = []
+        for event, *args in self.to_numpy().tolist():
+            event_format, is_cell = TRACE_FORMATS[event]
+            lines.append(event_format.format(*(
+                divmod(arg, column_size) if cell_arg else arg
+                for arg, cell_arg in zip(args, is_cell)
+            )))
+        return lines
 
 """## BOT LOGIC
 
@@ -371,16 +1271,408 @@ class Constraints:
 """
 
 class Search_Algorithm:
+    # is_add_neighbor depends on the path length, which no passable mask can hold
+    has_path_length_rule = False
+
     def __init__(self, ship, constraints, log_level):
         self.constraints = constraints
         self.local_ship = ship
         self.local_grid = np.copy(ship.grid)
+        self.flat_grid = self.local_grid.reshape(-1)
         self.curr_pos = self.start_cell = ship.start
         self.captain_cell = ship.goal
         self.row_size = ship.row_size
         self.column_size = ship.column_size
         self.path_pos = 0
         self.log_level = log_level
+        self.planners = {}
+        self.oracles = {}
+        self.nodes_expanded = 0 # cells expanded by every search of the bot
+        self.profile = None # Bot_Profile, only set by Bot_Profile.install
+        self.tracer = Event_Tracer() if log_level >= LOG_DEBUG else None
+        self.neighbor_offsets, self.neighbor_indices = ship.neighbor_tables()
+        # never written, visited_cells of the gradient descent as no cell repeats on it
+        self.unvisited_cells = bytearray(self.row_size * self.column_size)
+
+    """
+        Returns a boolean matrix of the cells the bot is allowed to move into.
+        Child classes can add their own restrictions, the current bot cell is
+        always treated as passable. Restrictions that depend on the path
+        length go in is_add_neighbor with has_path_length_rule instead.
+    """
+
+    def passable_cells(self, grid_copy, neighbor_filter):
+        return self.filter_cells(grid_copy, neighbor_filter)
+
+    """
+        Returns a boolean matrix of the cells matching neighbor_filter, for
+        both plain grids and alien move overlays.
+    """
+
+    def filter_cells(self, grid_copy, neighbor_filter):
+        if isinstance(grid_copy, Alien_Move_Overlay):
+            return grid_copy.filter_cells(neighbor_filter)
+        return (grid_copy & neighbor_filter) != 0
+
+    """
+        Return the path from Bot cell to Captain cell using the search engine
+        selected by the constraints. Incremental planners are kept per
+        planner_name so that every grid the bot searches keeps its own state.
+        The incremental, bitboard and distance field engines cannot honor
+        queue_size, capped constraints use the BFS unless the memory bounded
+        search is selected. Bots with has_path_length_rule use the BFS in
+        place of the incremental and bitboard engines, which search masks.
+
+        With the reachability_oracle constraint the search is skipped
+        altogether on turns the captain is walled off by aliens, unless a
+        max_move_time search could still return a cut short path.
+    """
+
+    def find_path(self, itr_count, neighbor_filter, grid_copy=None, planner_name="local"):
+        if grid_copy is None:
+            grid_copy = self.local_grid
+
+        is_reachable = oracle = None
+        if self.constraints.reachability_oracle:
+            oracle = self.oracles.get(planner_name)
+        if oracle is not None:
+            self.update_oracle(oracle, grid_copy, neighbor_filter)
+            is_reachable = oracle.is_reachable(self.curr_pos, self.captain_cell)
+            # only a search cut short by the deadline returns a path to a
+            # captain it cannot reach
+            if is_reachable is False and self.constraints.max_move_time == -1:
+                self.path_pos = 0
+                if self.tracer is not None:
+                    self.tracer.record(TRACE_UNREACHABLE, itr_count)
+                return None
+
+        path = self.search_path(itr_count, neighbor_filter, grid_copy, planner_name)
+        if path is not None or not self.constraints.reachability_oracle:
+            return path
+
+        # oracles are only built once a search fails, episodes that never
+        # lose sight of the captain pay nothing for them
+        if oracle is None:
+            oracle = self.oracles[planner_name] = Reachability_Oracle(
+                self.row_size,
+                self.column_size,
+                (self.neighbor_offsets, self.neighbor_indices),
+            )
+            oracle.passable_view[:] = self.reachable_cells(
+                grid_copy, neighbor_filter
+            ).reshape(-1)
+        if is_reachable is not True:
+            oracle.rebuild()
+        return path
+
+    """
+        Returns a boolean matrix of every cell a search could move through,
+        searches only ever use a subset of these cells, so a captain cut off
+        here is cut off for every search mode and bot.
+    """
+
+    def reachable_cells(self, grid_copy, neighbor_filter):
+        passable = self.filter_cells(grid_copy, neighbor_filter)
+        passable[self.curr_pos] = True
+        return passable
+
+    """
+        Applies the grid cells written since the last query of the oracle,
+        cell by cell as reachable_cells would see them. On an alien move
+        overlay a written cell also changes the cells next to it.
+    """
+
+    def update_oracle(self, oracle, grid_copy, neighbor_filter):
+        changed_cells = set(oracle.changed_cells)
+        del oracle.changed_cells[:]
+        if isinstance(grid_copy, Alien_Move_Overlay):
+            for cell in list(changed_cells):
+                changed_cells.update(
+                    self.neighbor_indices[
+                        self.neighbor_offsets[cell] : self.neighbor_offsets[cell + 1]
+                    ]
+                )
+
+        curr_index = self.cell_index(self.curr_pos)
+        oracle.update_cells(
+            changed_cells,
+            [
+                cell == curr_index
+                or bool(grid_copy[self.index_cell(cell)] & neighbor_filter)
+                for cell in changed_cells
+            ],
+        )
+
+    """
+        Queues the flattened indices of written grid cells for every
+        reachability oracle, they are applied on its next query.
+    """
+
+    def record_changed_cells(self, cells):
+        for oracle in self.oracles.values():
+            oracle.changed_cells.extend(cells)
+
+    def search_path(self, itr_count, neighbor_filter, grid_copy, planner_name):
+        search_mode = self.constraints.search_mode
+        if (
+            self.constraints.max_move_time != -1
+            or search_mode == SEARCH_MEMORY_BOUNDED
+        ):
+            return self.find_best_first_path(itr_count, neighbor_filter, grid_copy)
+
+        if search_mode == SEARCH_BFS or self.constraints.queue_size != -1:
+            return self.find_shortest_path(itr_count, neighbor_filter, grid_copy)
+        if search_mode == SEARCH_DISTANCE_FIELD:
+            return self.find_gradient_path(itr_count, neighbor_filter, grid_copy)
+        if self.has_path_length_rule:
+            return self.find_shortest_path(itr_count, neighbor_filter, grid_copy)
+
+        if grid_copy is None:
+            grid_copy = self.local_grid
+
+        passable = self.passable_cells(grid_copy, neighbor_filter)
+        passable[self.curr_pos] = True
+        self.path_pos = 0
+
+        if search_mode == SEARCH_BITBOARD:
+            bitboards = self.local_ship.bitboard_grid()
+            path = bitboards.find_shortest_path(
+                self.curr_pos, self.captain_cell, passable
+            )
+            self.nodes_expanded += bitboards.nodes_expanded
+        else:
+            planner = self.planners.get(planner_name)
+            if planner is None:
+                planner = self.planners[planner_name] = Incremental_Planner(
+                    self.row_size,
+                    self.column_size,
+                    self.captain_cell,
+                    (self.neighbor_offsets, self.neighbor_indices),
+                )
+            nodes_expanded = planner.nodes_expanded
+            path = planner.find_path(self.curr_pos, passable)
+            self.nodes_expanded += planner.nodes_expanded - nodes_expanded
+            if self.profile is not None:
+                # the heap left after the repair, its peak is not tracked
+                self.profile.record_queue(len(planner.open_heap))
+        if self.tracer is not None and path is not None:
+            self.tracer.record(TRACE_PATH, itr_count, len(path))
+        return path
+
+    """
+        Return the Shortest path from Bot cell to Captain cell by descending
+        the ship's captain distance field.
+
+        Every step goes to a neighbor one step closer to the captain on the
+        empty ship, so a path found this way can never be beaten once aliens
+        block cells. A descent that gets blocked (or rejected by
+        is_add_neighbor) backs up and tries the other closer neighbors,
+        cells known to dead end are not tried again. Only when no such path
+        is left does it fall back to a full search.
+    """
+
+    def find_gradient_path(self, itr_count, neighbor_filter, grid_copy=None):
+        if grid_copy is None:
+            grid_copy = self.local_grid
+
+        distance_field = self.local_ship.captain_distance_field()
+        cell_index = self.cell_index(self.curr_pos)
+        distance = distance_field[cell_index]
+        if distance == -1:
+            return None
+
+        self.path_pos = 0
+        self.visited_cells = self.unvisited_cells
+        neighbor_offsets = self.neighbor_offsets
+        neighbor_indices = self.neighbor_indices
+        dead_end_cells = set()
+        path_indices = [cell_index]
+        # untried neighbors of every cell on the path
+        branches = [iter(neighbor_indices[neighbor_offsets[cell_index] : neighbor_offsets[cell_index + 1]])]
+        while distance:
+            for neighbor_index in branches[-1]:
+                if (
+                    distance_field[neighbor_index] == distance - 1
+                    and neighbor_index not in dead_end_cells
+                    and grid_copy[self.index_cell(neighbor_index)] & neighbor_filter
+                    and self.is_add_neighbor(
+                        grid_copy, neighbor_index, len(path_indices)
+                    )
+                ):
+                    break
+            else:
+                dead_end_cells.add(path_indices.pop())
+                branches.pop()
+                if not path_indices:
+                    return self.find_shortest_path(itr_count, neighbor_filter, grid_copy)
+                distance += 1
+                continue
+
+            distance -= 1
+            self.nodes_expanded += 1
+            path_indices.append(neighbor_index)
+            branches.append(iter(
+                neighbor_indices[neighbor_offsets[neighbor_index] : neighbor_offsets[neighbor_index + 1]]
+            ))
+
+        path_traversed = [self.curr_pos]
+        path_traversed.extend(self.index_cell(cell_index) for cell_index in path_indices[1:])
+
+        if self.tracer is not None:
+            self.tracer.record(TRACE_PATH, itr_count, len(path_traversed))
+        return path_traversed
+
+    """
+        Return a path from Bot cell towards Captain cell with bounded time
+        and memory.
+
+        A* over flattened cell indices with the manhattan distance to the
+        captain, limited by
+            max_move_time - time budget per search (ns, same clock as
+                max_search_time)
+            queue_size - max no of frontier cells, only in the memory bounded
+                search mode. Once it is exceeded the frontier keeps its best
+                three quarters by estimated path length and forgets the rest,
+                which can be found again later through another cell.
+
+        Cells are filtered like in the BFS, with is_add_neighbor given the
+        path length of the cell they are reached from, so a bot's own rules
+        (Bot_4's alien check on the first five steps) hold as they are.
+
+        If a limit stops the search before the captain is reached, the path
+        to the expanded cell closest to the captain is returned instead, so
+        the bot keeps making progress and searches again at its end. That
+        is, the time ran out or the frontier forgot cells that were never
+        reached again. None is returned if the search went through every
+        cell it could reach without finding the captain, or nothing closer
+        to it was expanded.
+
+        alien_arrival - array (optional)
+            no of alien moves after which an alien may be in every flattened
+            cell index. Reaching a cell in k moves then also needs
+            alien_arrival > k for the first space_time_horizon moves, which
+            replaces the bot's own is_add_neighbor restrictions.
+    """
+
+    def find_best_first_path(
+        self, itr_count, neighbor_filter, grid_copy=None, alien_arrival=None
+    ):
+        deadline = -1
+        if self.constraints.max_move_time != -1:
+            deadline = time.process_time_ns() + self.constraints.max_move_time
+        frontier_size = -1
+        if self.constraints.search_mode == SEARCH_MEMORY_BOUNDED:
+            frontier_size = self.constraints.queue_size
+        if grid_copy is None:
+            grid_copy = self.local_grid
+
+        total_cells = self.row_size * self.column_size
+        is_add_neighbor = None
+        if alien_arrival is None:
+            horizon = 0
+            # nothing is visited, cells can be reached again at a lower cost
+            self.visited_cells = self.unvisited_cells
+            is_add_neighbor = self.is_add_neighbor
+        else:
+            horizon = self.constraints.space_time_horizon
+        passable = self.filter_cells(grid_copy, neighbor_filter)
+        is_passable = passable.reshape(-1).tobytes()
+        captain_row, captain_col = self.captain_cell
+        captain_index = self.cell_index(self.captain_cell)
+        start_index = self.cell_index(self.curr_pos)
+        self.parent_cells = array("i", [-1]) * total_cells
+        path_cost = array("i", [total_cells]) * total_cells
+        path_cost[start_index] = 0
+        self.path_pos = 0
+
+        best_index = start_index
+        best_distance = abs(self.curr_pos[0] - captain_row) + abs(
+            self.curr_pos[1] - captain_col
+        )
+        # heap - [ (path_cost + distance, distance, cell_index), ... ]
+        open_heap = [(best_distance, best_distance, start_index)]
+        expanded_cells = 0
+        is_cut_short = False
+        evicted_cells = []
+        is_profiled = self.profile is not None
+        while open_heap:
+            if is_profiled:
+                self.profile.record_queue(len(open_heap))
+            estimate, distance, cell = heapq.heappop(open_heap)
+            cost = estimate - distance
+            if cost > path_cost[cell]:
+                continue
+            if cell == captain_index:
+                best_index = cell
+                break
+            if distance < best_distance:
+                best_index, best_distance = cell, distance
+
+            expanded_cells += 1
+            if (
+                deadline != -1
+                and expanded_cells % TIMER_CHECK_INTERVAL == 0
+                and time.process_time_ns() > deadline
+            ):
+                is_cut_short = True
+                break
+
+            cost += 1
+            for neighbor in self.neighbor_indices[
+                self.neighbor_offsets[cell] : self.neighbor_offsets[cell + 1]
+            ]:
+                if (
+                    is_passable[neighbor]
+                    and cost < path_cost[neighbor]
+                    and (
+                        cost > horizon
+                        or alien_arrival[neighbor] > cost
+                        # the episode ends on the captain before aliens move
+                        or (neighbor == captain_index and alien_arrival[neighbor] == cost)
+                    )
+                    and (
+                        is_add_neighbor is None
+                        or is_add_neighbor(grid_copy, neighbor, cost)
+                    )
+                ):
+                    path_cost[neighbor] = cost
+                    self.parent_cells[neighbor] = cell
+                    row, col = divmod(neighbor, self.column_size)
+                    distance = abs(row - captain_row) + abs(col - captain_col)
+                    heapq.heappush(open_heap, (cost + distance, distance, neighbor))
+
+            if frontier_size != -1 and len(open_heap) > frontier_size:
+                open_heap.sort()
+                for estimate, distance, cell in open_heap[
+                    max(frontier_size * 3 // 4, 1) :
+                ]:
+                    if estimate - distance == path_cost[cell]:
+                        path_cost[cell] = total_cells
+                        evicted_cells.append(cell)
+                del open_heap[max(frontier_size * 3 // 4, 1) :]
+
+        self.nodes_expanded += expanded_cells
+        if not is_cut_short and best_index != captain_index:
+            # forgotten cells found again later were searched through after
+            # all, else only a flood of the cells can tell if it ran out
+            is_cut_short = any(
+                path_cost[cell] == total_cells for cell in evicted_cells
+            ) and self.local_ship.bitboard_grid().is_reachable(
+                self.curr_pos, self.captain_cell, passable
+            )
+        if best_index == start_index or (best_index != captain_index and not is_cut_short):
+            return None
+
+        path = self.reconstruct_path(best_index)
+        if self.tracer is not None:
+            self.tracer.record(TRACE_CUT_SHORT_PATH if is_cut_short else TRACE_PATH, itr_count, len(path))
+        return path
+
+    def cell_index(self, cell):
+        return cell[0] * self.column_size + cell[1]
+
+    def index_cell(self, index):
+        return divmod(index, self.column_size)
 
     """
         Virtual Class that verifies if the neighbor was already visited.
@@ -388,10 +1680,10 @@ class Search_Algorithm:
 
         Parameters
         ----------
-            neighbor - list
-                list containing x and y cord : (0,0)
-            visited_cells - set(list)
-                set containing all the visited cells : [(0,0), (1,1), ...]
+            neighbor_index - int
+                flattened index of the neighbor (row * column_size + column) : 12
+            path_length - int
+                length of the path traversed to reach the current cell : 5
 
         Returns
         ----------
@@ -399,12 +1691,33 @@ class Search_Algorithm:
             returns true if neighbor can be added to queue : true/false
     """
 
-    def is_add_neighbor(self, grid_copy, neighbor, path_traversed):
-        return neighbor not in self.visited_cells
+    def is_add_neighbor(self, grid_copy, neighbor_index, path_length):
+        return not self.visited_cells[neighbor_index]
+
+    """
+        Walks the parent pointers back from the given cell to the bot cell
+
+        Returns
+        ----------
+        set(list)
+            path from bot cell to given cell : [(0, 0), (0, 1), ... (x, y)]
+    """
+
+    def reconstruct_path(self, cell_index):
+        path = []
+        while cell_index != -1:
+            path.append(self.index_cell(cell_index))
+            cell_index = self.parent_cells[cell_index]
+        path.reverse()
+        return path
 
     """
         Return the Shortest path from Bot cell to Captain cell
 
+        Cells are tracked by their flattened index, visited_cells and
+        parent_cells are arrays over those indices, and the path is only
+        built once the captain is reached.
+
         Parameters
         ----------
             itr_completed - int
@@ -419,93 +1732,69 @@ class Search_Algorithm:
     """
 
     def find_shortest_path(self, itr_count, neighbor_filter, grid_copy=None):
-        bfs_queue = []
-        self.visited_cells = set()
+        bfs_queue = deque()
+        total_cells = self.row_size * self.column_size
+        self.visited_cells = bytearray(total_cells)
+        self.parent_cells = array("i", [-1]) * total_cells
         self.path_pos = 0
 
         if grid_copy is None:
             grid_copy = self.local_grid
 
-        # queue - [ (current_cell, (... path_traversed ...)), ... ]
-        bfs_queue.append((self.curr_pos, [self.curr_pos]))
+        is_passable = self.filter_cells(grid_copy, neighbor_filter).reshape(-1).tobytes()
 
-        while bfs_queue:
-            current_cell, path_traversed = bfs_queue.pop(0)
-
-            self.log_data(
-                LOG_DEBUG,
-                "current_cell",
-                type(current_cell),
-                len(current_cell),
-                current_cell,
-            )
-            self.log_data(
-                LOG_DEBUG,
-                "path_traversed",
-                type(path_traversed),
-                len(path_traversed),
-                path_traversed,
-            )
+        captain_index = self.cell_index(self.captain_cell)
+        neighbor_offsets = self.neighbor_offsets
+        neighbor_indices = self.neighbor_indices
 
-            if current_cell == self.captain_cell:
-                self.log_data(
-                    LOG_DEBUG,
-                    f"Iterations Completed : {itr_count}\tPath Length : {len(path_traversed)}\tBot Path : {path_traversed}",
-                )
+        # queue - [ (current_index, parent_index, path_length), ... ]
+        bfs_queue.append((self.cell_index(self.curr_pos), -1, 1))
+        is_profiled = self.profile is not None
+        tracer = self.tracer
+
+        while bfs_queue:
+            if is_profiled:
+                self.profile.record_queue(len(bfs_queue))
+            current_index, parent_index, path_length = bfs_queue.popleft()
+
+            if tracer is not None:
+                tracer.record(TRACE_NODE, current_index, path_length)
+
+            if current_index == captain_index:
+                self.parent_cells[current_index] = parent_index
+                path_traversed = self.reconstruct_path(current_index)
+                if tracer is not None:
+                    tracer.record(TRACE_PATH, itr_count, len(path_traversed))
                 return path_traversed
-            elif current_cell in self.visited_cells:
+            elif self.visited_cells[current_index]:
                 continue
 
-            self.visited_cells.add(current_cell)
-            self.log_data(
-                LOG_DEBUG,
-                "visited_cells",
-                type(self.visited_cells),
-                len(self.visited_cells),
-                self.visited_cells,
-            )
-
-            current_cell_neighbors = get_neighbors(
-                self.row_size,
-                self.column_size,
-                current_cell,
-                neighbor_filter,
-                grid_copy,
-            )
+            self.visited_cells[current_index] = 1
+            self.parent_cells[current_index] = parent_index
+            self.nodes_expanded += 1
 
-            for neighbor in current_cell_neighbors:
-                if (
+            for neighbor_index in neighbor_indices[
+                neighbor_offsets[current_index] : neighbor_offsets[current_index + 1]
+            ]:
+                if is_passable[neighbor_index] and (
                     self.constraints.queue_size == -1
                     or len(bfs_queue) <= self.constraints.queue_size
-                ) and (self.is_add_neighbor(grid_copy, neighbor, path_traversed)):
-                    bfs_queue.append((neighbor, path_traversed + [neighbor]))
+                ) and (self.is_add_neighbor(grid_copy, neighbor_index, path_length)):
+                    bfs_queue.append((neighbor_index, current_index, path_length + 1))
 
         return None
 
     def sort_neighbors_by_alien(self, neighbor_cells, grid_copy):
         safest_neighbor = []
         for neighbor in neighbor_cells:
-            adj_alien_cell_len = len(
-                get_neighbors(
-                    self.row_size,
-                    self.column_size,
-                    neighbor,
-                    ALL_ALIEN_CELLS,
-                    grid_copy,
-                )
-            )
-            adj_alien_movements_len = len(
-                get_neighbors(
-                    self.row_size,
-                    self.column_size,
+            neighbor_index = self.cell_index(neighbor)
+            safest_neighbor.append(
+                (
                     neighbor,
-                    MOVED_ALIEN_CELL | MOVED_ALIEN_CAPTAIN_CELL,
-                    grid_copy,
+                    self.alien_adjacency[neighbor_index],
+                    self.alien_move_adjacency[neighbor_index],
                 )
             )
-            safest_neighbor.append(
-                (neighbor, adj_alien_cell_len, adj_alien_movements_len)
-            )
 
         safest_neighbor = sorted(
             sorted(safest_neighbor, key=lambda x: x[2]),
@@ -528,10 +1817,10 @@ class Search_Algorithm:
 
         safest_neighbor = self.sort_neighbors_by_alien(neighbor_cells, grid_copy)
         escape_path = [self.curr_pos, safest_neighbor[0][0]]
-        self.log_data(
-            LOG_DEBUG,
-            f"Iterations Completed : {itr_count}\tEscape Path : {escape_path}",
-        )
+        if self.tracer is not None:
+            self.tracer.record(
+                TRACE_ESCAPE, itr_count, self.cell_index(self.curr_pos), self.cell_index(escape_path[1])
+            )
 
         return escape_path
 
@@ -546,10 +1835,10 @@ class Search_Algorithm:
 
         if len(adj_alien_movements) > 0:  # handling edge cases, if any
             cap_path = [self.curr_pos, adj_alien_movements[0]]
-            self.log_data(
-                LOG_DEBUG,
-                f"Iterations Completed : {itr_count}\tEscape Path : {cap_path}",
-            )
+            if self.tracer is not None:
+                self.tracer.record(
+                    TRACE_ESCAPE, itr_count, self.cell_index(self.curr_pos), self.cell_index(cap_path[1])
+                )
             return cap_path
 
         adj_alien_movements = get_neighbors(
@@ -564,10 +1853,10 @@ class Search_Algorithm:
 
         safest_neighbor = self.sort_neighbors_by_alien(adj_alien_movements, grid_copy)
         escape_path = [self.curr_pos, safest_neighbor[0][0]]
-        self.log_data(
-            LOG_DEBUG,
-            f"Iterations Completed : {itr_count}\tEscape Path : {escape_path}",
-        )
+        if self.tracer is not None:
+            self.tracer.record(
+                TRACE_ESCAPE, itr_count, self.cell_index(self.curr_pos), self.cell_index(escape_path[1])
+            )
 
         return escape_path
 
@@ -584,6 +1873,111 @@ class Search_Algorithm:
 
         return safe_path
 
+"""### BOT PROFILE
+
+    Per phase cumulative timers and counters of one bot. Off unless
+    Bot_Profile.install(bot) is called, which wraps the PROFILED_PHASES
+    methods of that bot instance only, every other bot runs the plain
+    methods and the few counters inside the search loops sit behind one
+    local flag per search.
+
+    Phase times are inclusive, find_path also holds the find_shortest_path
+    it runs, searches only counts the outermost search of a nesting.
+"""
+
+PROFILED_PHASES = (
+    "find_path",
+    "find_shortest_path",
+    "find_best_first_path",
+    "find_gradient_path",
+    "find_space_time_path",
+    "find_fallback_path",
+    "alien_arrival_times",
+    "clone_grid_with_alien_moves",
+    "escape_nearby_aliens",
+    "move_bot",
+    "move_aliens",
+)
+SEARCH_PHASES = {
+    "find_path",
+    "find_shortest_path",
+    "find_best_first_path",
+    "find_gradient_path",
+    "find_space_time_path",
+}
+
+class Bot_Profile:
+    COUNTERS = ("episodes", "moves", "searches", "nodes_expanded", "replans_skipped", "idle_moves")
+
+    def __init__(self):
+        self.phase_times = dict.fromkeys(PROFILED_PHASES, 0)
+        self.phase_calls = dict.fromkeys(PROFILED_PHASES, 0)
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.queue_peak = 0
+        self.search_depth = 0
+
+    @classmethod
+    def install(cls, bot):
+        profile = bot.profile = cls()
+        for phase in PROFILED_PHASES:
+            method = getattr(bot, phase, None)
+            if method is not None:
+                setattr(bot, phase, profile.wrap(phase, method))
+        return profile
+
+    def wrap(self, phase, method):
+        is_search = phase in SEARCH_PHASES
+
+        def timed_method(*args, **kwargs):
+            if is_search:
+                if not self.search_depth:
+                    self.counters["searches"] += 1
+                self.search_depth += 1
+            timer_start = time.perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.phase_times[phase] += time.perf_counter_ns() - timer_start
+                self.phase_calls[phase] += 1
+                if is_search:
+                    self.search_depth -= 1
+
+        return timed_method
+
+    def record_queue(self, queue_size):
+        if queue_size > self.queue_peak:
+            self.queue_peak = queue_size
+
+    def finish(self, bot):
+        self.counters["episodes"] += 1
+        self.counters["moves"] += bot.bot_moves
+        self.counters["nodes_expanded"] += bot.nodes_expanded
+        self.counters["idle_moves"] += bot.idle_moves
+
+    def merge(self, profile):
+        for phase in PROFILED_PHASES:
+            self.phase_times[phase] += profile.phase_times[phase]
+            self.phase_calls[phase] += profile.phase_calls[phase]
+        for counter in self.COUNTERS:
+            self.counters[counter] += profile.counters[counter]
+        self.queue_peak = max(self.queue_peak, profile.queue_peak)
+
+    def summary(self):
+        return {
+            **self.counters,
+            "queue_peak": self.queue_peak,
+            "phase_ms": {
+                phase: self.phase_times[phase] / 1e6
+                for phase in PROFILED_PHASES
+                if self.phase_calls[phase]
+            },
+            "phase_calls": {
+                phase: self.phase_calls[phase]
+                for phase in PROFILED_PHASES
+                if self.phase_calls[phase]
+            },
+        }
+
 """### PARENT BOT"""
 
 class Parent_Bot(Search_Algorithm):
@@ -591,11 +1985,18 @@ class Parent_Bot(Search_Algorithm):
         super(Parent_Bot, self).__init__(ship, constraints, log_level)
         self.bot_path = [self.start_cell]
         self.alien_cells = ship.alien_cells.copy()
-        self.visited_cells = self.bot_caught_cell = self.path = None
+        self.visited_cells = self.parent_cells = None
+        self.bot_caught_cell = self.path = None
         self.idle_moves = self.bot_moves = 0
         self.status = BOT_FAILURE
         self.flag = FINDING_PATH_FLAG
         self.time_start = self.time_end = self.time_elapsed = 0
+        self.trace = None # Episode_Trace, records every turn when set
+        self.init_alien_counters()
+        far_distance = self.row_size * self.column_size
+        self.alien_distance = array("i", [far_distance]) * far_distance
+        self.alien_distance_cells = [] # cells the last map set, reset by the next one
+        self.is_alien_distance_stale = True
 
     def log_data(self, log_level, *args):
         if (self.log_level) and (log_level <= self.log_level):
@@ -614,7 +2015,18 @@ class Parent_Bot(Search_Algorithm):
         self.time_elapsed = self.time_end - self.time_start
         return self.time_elapsed
 
+    """
+        Partial paths from an anytime search end short of the captain, the
+        bot has to search again once it walked all of it.
+    """
+
+    def is_path_exhausted(self):
+        return self.path_pos + 1 >= len(self.path)
+
     def is_stop_search(self):
+        if self.trace is not None:
+            self.trace.record(self)
+
         if (self.constraints.max_search_time != -1) and (
             self.end_timer() > self.constraints.max_search_time
         ):
@@ -626,6 +2038,55 @@ class Parent_Bot(Search_Algorithm):
             return True
         return False
 
+    """
+        Per cell counters over flattened cell indices, kept in sync with
+        local_grid by update_alien_counters whenever a cell changes. Only
+        the counters of non closed cells are maintained.
+
+        alien_adjacency - no of adjacent aliens
+        alien_move_adjacency - no of adjacent open or captain cells that an
+            alien can move into on its next turn
+    """
+
+    def init_alien_counters(self):
+        is_alien = (self.local_grid & ALL_ALIEN_CELLS) != 0
+        alien_adjacency = count_adjacent(is_alien)
+        is_alien_move = ((self.local_grid & MOVEMENT_CELLS) != 0) & (
+            alien_adjacency > 0
+        )
+        self.is_alien_cell = bytearray(is_alien.reshape(-1))
+        self.is_alien_move_cell = bytearray(is_alien_move.reshape(-1))
+        self.alien_adjacency = array("h", alien_adjacency.tobytes())
+        self.alien_move_adjacency = array("h", count_adjacent(is_alien_move).tobytes())
+
+    def refresh_alien_move(self, index, cell):
+        is_alien_move = bool(
+            self.alien_adjacency[index] and self.local_grid[cell] & MOVEMENT_CELLS
+        )
+        if is_alien_move == self.is_alien_move_cell[index]:
+            return
+
+        self.is_alien_move_cell[index] = is_alien_move
+        delta = 1 if is_alien_move else -1
+        for neighbor in self.neighbor_indices[
+            self.neighbor_offsets[index] : self.neighbor_offsets[index + 1]
+        ]:
+            self.alien_move_adjacency[neighbor] += delta
+
+    def update_alien_counters(self, cell):
+        index = self.cell_index(cell)
+        is_alien = bool(self.local_grid[cell] & ALL_ALIEN_CELLS)
+        if is_alien != self.is_alien_cell[index]:
+            self.is_alien_cell[index] = is_alien
+            delta = 1 if is_alien else -1
+            for neighbor in self.neighbor_indices[
+                self.neighbor_offsets[index] : self.neighbor_offsets[index + 1]
+            ]:
+                self.alien_adjacency[neighbor] += delta
+                self.refresh_alien_move(neighbor, self.index_cell(neighbor))
+
+        self.refresh_alien_move(index, cell)
+
     def move_bot(self):
         self.path_pos += 1
         next_cell = self.path[self.path_pos]
@@ -642,74 +2103,206 @@ class Parent_Bot(Search_Algorithm):
             self.local_grid[next_cell] = BOT_SUCCESS_CELL
             retVal = True
         else:
-            self.local_grid[next_cell] = BOT_CELL
+            self.local_grid[next_cell] = BOT_CELL
+
+        self.local_grid[self.curr_pos] = OPEN_CELL
+        self.update_alien_counters(self.curr_pos)
+        self.update_alien_counters(next_cell)
+        self.record_changed_cells((self.cell_index(self.curr_pos), self.cell_index(next_cell)))
+        self.curr_pos = next_cell
+        self.bot_path.append(next_cell)
+
+        return retVal
+
+    """
+        Returns the no of alien moves needed to reach every flattened cell
+        index, found with a single multi-source BFS from all the aliens.
+        Computed at most once per turn, cells farther than
+        ALIEN_DANGER_RADIUS are left at row_size * column_size. Only the
+        cells the last map set are reset, so a turn costs O(aliens).
+    """
+
+    def alien_distance_map(self):
+        alien_distance = self.alien_distance
+        if not self.is_alien_distance_stale:
+            return alien_distance
+
+        far_distance = self.row_size * self.column_size
+        for cell in self.alien_distance_cells:
+            alien_distance[cell] = far_distance
+
+        bfs_queue = deque()
+        for alien in self.alien_cells:
+            alien_index = self.cell_index(alien)
+            alien_distance[alien_index] = 0
+            bfs_queue.append(alien_index)
+        reached_cells = list(bfs_queue)
+
+        while bfs_queue:
+            cell = bfs_queue.popleft()
+            distance = alien_distance[cell] + 1
+            if distance > ALIEN_DANGER_RADIUS:
+                continue
+            for neighbor in self.neighbor_indices[
+                self.neighbor_offsets[cell] : self.neighbor_offsets[cell + 1]
+            ]:
+                if alien_distance[neighbor] > distance:
+                    alien_distance[neighbor] = distance
+                    bfs_queue.append(neighbor)
+                    reached_cells.append(neighbor)
+
+        self.alien_distance_cells = reached_cells
+        self.is_alien_distance_stale = False
+        return alien_distance
+
+    """
+        Moves every alien once, in a random order, to a random neighboring
+        open, captain or bot cell, returns True if an alien caught the bot.
+
+        All random draws are made with one call and every move is worked out
+        at once against the grid at the start of the turn. Only aliens within
+        two cells of an alien that moves before them, or next to the bot, can
+        see a different grid than that, so only those are moved one by one in
+        order with the other moves written back in bulk in between. The
+        outcome is the same as moving every alien one after the other.
+    """
+
+    def move_aliens(self):
+        self.is_alien_distance_stale = True
+        total_aliens = len(self.alien_cells)
+        if not total_aliens:
+            return False
+
+        order_draws, move_draws = np.random.random((2, total_aliens))
+        alien_order = np.argsort(order_draws)
+        self.alien_cells = [self.alien_cells[itr] for itr in alien_order.tolist()]
+        alien_positions = np.array(self.alien_cells, dtype=np.intp)
+        aliens = alien_positions[:, 0] * self.column_size + alien_positions[:, 1]
+
+        total_cells = self.row_size * self.column_size
+        neighbors = self.local_ship.neighbor_matrix()[aliens]
+        has_neighbor = neighbors != total_cells
+        is_move = has_neighbor & (
+            (self.flat_grid[np.where(has_neighbor, neighbors, 0)] & ALIEN_MOVEMENT_CELLS) != 0
+        )
+        move_count = is_move.sum(axis=1)
+        move_choice = (move_draws * move_count).astype(np.intp)
+        move_column = (np.cumsum(is_move, axis=1) > move_choice[:, None]).argmax(axis=1)
+        new_cells = neighbors[np.arange(total_aliens), move_column]
+
+        # an alien reads its neighbors and writes its own cell or a neighbor
+        alien_turns = np.arange(total_aliens, dtype=np.int32)
+        first_writers = self.local_ship.first_writers()
+        write_cells = np.concatenate((aliens, neighbors.reshape(-1)))
+        first_writers[write_cells] = total_aliens
+        np.minimum.at(
+            first_writers,
+            write_cells,
+            np.concatenate((alien_turns, np.repeat(alien_turns, 4))),
+        )
+        first_writers[total_cells] = total_aliens
+        is_sequential = (first_writers[neighbors].min(axis=1) < alien_turns) | (
+            neighbors == self.cell_index(self.curr_pos)
+        ).any(axis=1)
+        is_batch = ~is_sequential & (move_count > 0)
+
+        moved_cells = []
+        batch_start = 0
+        for itr in np.flatnonzero(is_sequential).tolist():
+            self.move_alien_batch(aliens, new_cells, is_batch, batch_start, itr, moved_cells)
+            batch_start = itr + 1
+            new_cell = self.move_alien(itr, aliens[itr], move_draws[itr])
+            if self.flag == BOT_CAUGHT_FLAG:
+                aliens[itr] = self.cell_index(self.bot_caught_cell)
+                self.alien_cells = list(zip(*np.divmod(aliens, self.column_size)))
+                return True
+            if new_cell is not None:
+                moved_cells.append(aliens[itr])
+                moved_cells.append(new_cell)
+                aliens[itr] = new_cell
+        self.move_alien_batch(aliens, new_cells, is_batch, batch_start, total_aliens, moved_cells)
+
+        # Update alien_cells with new locations
+        self.alien_cells = list(zip(*np.divmod(aliens, self.column_size)))
+        self.record_changed_cells(moved_cells)
+        if len(moved_cells) * ALIEN_COUNTER_REBUILD_RATIO > total_cells:
+            self.init_alien_counters()
+        else:
+            for cell in moved_cells:
+                self.update_alien_counters(self.index_cell(cell))
 
-        self.local_grid[self.curr_pos] = OPEN_CELL
-        self.curr_pos = next_cell
-        self.bot_path.append(next_cell)
+        return False
 
-        return retVal
+    """
+        Writes back the precomputed moves of the aliens from turn start to
+        turn end that need no ordering, none of them are near each other.
+    """
 
-    def move_aliens(self):
-        random.shuffle(self.alien_cells)
+    def move_alien_batch(self, aliens, new_cells, is_batch, start, end, moved_cells):
+        batch = start + np.flatnonzero(is_batch[start:end])
+        if not batch.size:
+            return
 
-        for itr, alien in enumerate(self.alien_cells):
-            alien_moves_possible = get_neighbors(
-                self.row_size,
-                self.column_size,
-                alien,
-                ALIEN_MOVEMENT_CELLS,
-                self.local_grid,
-            )
-            self.log_data(
-                LOG_DEBUG, f"Alien {itr, alien} has moves {alien_moves_possible}"
-            )
+        alien_batch = aliens[batch]
+        new_batch = new_cells[batch]
+        if self.tracer is not None:
+            for itr, alien, new_cell in zip(batch.tolist(), alien_batch.tolist(), new_batch.tolist()):
+                self.tracer.record(TRACE_ALIEN_MOVE, itr, alien, new_cell)
 
-            if len(alien_moves_possible) == 0:
-                self.log_data(
-                    LOG_DEBUG,
-                    f"Alien {itr, alien} has no moves",
-                )
-                continue
+        self.flat_grid[alien_batch] = np.where(
+            self.flat_grid[alien_batch] & CAPTAIN_ALIEN_CELL, CAPTAIN_CELL, OPEN_CELL
+        )
+        self.flat_grid[new_batch] = np.where(
+            self.flat_grid[new_batch] & CAPTAIN_CELL, CAPTAIN_ALIEN_CELL, ALIEN_CELL
+        )
+        aliens[batch] = new_batch
+        moved_cells.extend(alien_batch.tolist())
+        moved_cells.extend(new_batch.tolist())
 
-            alien_new_cell = random.choice(alien_moves_possible)
+    """
+        Moves one alien against the current grid, using move_draw in [0, 1)
+        to pick one of its possible moves. Returns the new flattened cell
+        index, None if the alien could not move.
+    """
 
-            if self.local_grid[alien_new_cell] & BOT_CELL:
-                self.log_data(
-                    LOG_DEBUG,
-                    f"Alien moves from current cell {itr, alien} to bot cell {alien_new_cell}",
-                )
-                self.flag = BOT_CAUGHT_FLAG
-                self.bot_caught_cell = alien_new_cell
-                self.local_grid[alien_new_cell] = BOT_CAUGHT_CELL
-                self.local_grid[alien] = OPEN_CELL
-                return True
-            elif self.local_grid[alien_new_cell] & CAPTAIN_CELL:
-                self.log_data(
-                    LOG_DEBUG,
-                    f"Alien moves from current cell {itr, alien} to captain cell {alien_new_cell}",
-                )
-                self.local_grid[alien_new_cell] = CAPTAIN_ALIEN_CELL
-                self.local_grid[alien] = OPEN_CELL
-            else:
-                if self.local_grid[alien] & CAPTAIN_ALIEN_CELL:
-                    self.log_data(
-                        LOG_DEBUG,
-                        f"Alien moves from captain cell {itr, alien, self.local_grid[alien]} to open cell {alien_new_cell}",
-                    )
-                    self.local_grid[alien] = CAPTAIN_CELL
-                else:
-                    self.log_data(
-                        LOG_DEBUG,
-                        f"Alien moves from current cell {itr, alien, self.local_grid[alien]} to open cell {alien_new_cell}",
-                    )
-                    self.local_grid[alien] = OPEN_CELL
-                self.local_grid[alien_new_cell] = ALIEN_CELL
+    def move_alien(self, itr, alien_index, move_draw):
+        alien = self.index_cell(alien_index)
+        alien_moves_possible = [
+            neighbor
+            for neighbor in self.neighbor_indices[
+                self.neighbor_offsets[alien_index] : self.neighbor_offsets[alien_index + 1]
+            ]
+            if self.flat_grid[neighbor] & ALIEN_MOVEMENT_CELLS
+        ]
 
-            # Update alien_cells with new location
-            self.alien_cells[itr] = alien_new_cell
+        if len(alien_moves_possible) == 0:
+            if self.tracer is not None:
+                self.tracer.record(TRACE_ALIEN_STUCK, itr, alien_index)
+            return None
 
-        return False
+        alien_new_index = alien_moves_possible[int(move_draw * len(alien_moves_possible))]
+        alien_new_cell = self.index_cell(alien_new_index)
+
+        if self.local_grid[alien_new_cell] & BOT_CELL:
+            if self.tracer is not None:
+                self.tracer.record(TRACE_ALIEN_CATCH, itr, alien_index, alien_new_index)
+            self.flag = BOT_CAUGHT_FLAG
+            self.bot_caught_cell = alien_new_cell
+            self.local_grid[alien_new_cell] = BOT_CAUGHT_CELL
+            self.local_grid[alien] = OPEN_CELL
+        elif self.local_grid[alien_new_cell] & CAPTAIN_CELL:
+            self.local_grid[alien_new_cell] = CAPTAIN_ALIEN_CELL
+            self.local_grid[alien] = OPEN_CELL
+        else:
+            if self.local_grid[alien] & CAPTAIN_ALIEN_CELL:
+                self.local_grid[alien] = CAPTAIN_CELL
+            else:
+                self.local_grid[alien] = OPEN_CELL
+            self.local_grid[alien_new_cell] = ALIEN_CELL
+
+        if self.tracer is not None and self.flag != BOT_CAUGHT_FLAG:
+            self.tracer.record(TRACE_ALIEN_MOVE, itr, alien_index, alien_new_index)
+        return alien_new_index
 
     def print_rescue_status(self):
         if self.flag == GOAL_REACHED_FLAG:
@@ -729,12 +2322,19 @@ class Parent_Bot(Search_Algorithm):
 
     def print_rescue_output(self):
         self.end_timer()
+        if self.trace is not None:
+            self.trace.finish(self)
+        if self.profile is not None:
+            self.profile.finish(self)
         self.print_rescue_status()
         self.log_data(LOG_INFO, self.bot_path)
         self.log_data(LOG_INFO, f"no of steps taken = {len(self.bot_path)}")
         if self.idle_moves:
             self.log_data(LOG_INFO, f"no of idle moves = {self.idle_moves}")
         self.log_data(LOG_INFO, f"total iterations = {self.bot_moves}")
+        if self.tracer is not None and self.log_level >= LOG_DEBUG:
+            for line in self.tracer.format_events(self.column_size):
+                print(line)
 
 """### BOT 1
 
@@ -772,7 +2372,11 @@ class Bot_2(Parent_Bot):
         super(Bot_2, self).__init__(ship, constraints, log_level)
 
     def is_recalculate_path(self):
-        return (self.path is None) or (self.path in self.alien_cells)
+        return (
+            (self.path is None)
+            or self.is_path_exhausted()
+            or (self.path in self.alien_cells)
+        )
 
     def start_rescue(self):
         self.start_timer()
@@ -784,7 +2388,9 @@ class Bot_2(Parent_Bot):
                 not self.constraints.reduce_search_frequenzy
                 or self.is_recalculate_path()
             ):
-                self.path = self.find_shortest_path(self.bot_moves, MOVEMENT_CELLS)
+                self.path = self.find_path(self.bot_moves, MOVEMENT_CELLS)
+            elif self.profile is not None:
+                self.profile.counters["replans_skipped"] += 1
 
             self.display_grid(LOG_DEBUG)
             if self.path is None:
@@ -804,21 +2410,11 @@ class Bot_3(Bot_2):
     def __init__(self, ship, constraints, log_level=LOG_INFO):
         super(Bot_3, self).__init__(ship, constraints, log_level)
 
-    def clone_grid_with_alien_moves(self):
-        clone_grid = np.copy(self.local_grid)
-
-        for alien in self.alien_cells:
-            adj_cells = get_neighbors(
-                self.row_size, self.column_size, alien, MOVEMENT_CELLS, self.local_grid
-            )
-            for cell in adj_cells:
-                clone_grid[cell] = (
-                    MOVED_ALIEN_CELL
-                    if clone_grid[cell] & OPEN_CELL
-                    else MOVED_ALIEN_CAPTAIN_CELL
-                )
+    def alien_move_cells(self):
+        return MOVEMENT_CELLS
 
-        return clone_grid
+    def clone_grid_with_alien_moves(self):
+        return Alien_Move_Overlay(self.local_grid, self.alien_move_cells())
 
     def start_rescue(self):
         self.start_timer()
@@ -830,13 +2426,15 @@ class Bot_3(Bot_2):
                 not self.constraints.reduce_search_frequenzy
             ) or self.is_recalculate_path():
                 grid_alien_move_copy = self.clone_grid_with_alien_moves()
-                self.path = self.find_shortest_path(
-                    self.bot_moves, MOVEMENT_CELLS, grid_alien_move_copy
+                self.path = self.find_path(
+                    self.bot_moves, MOVEMENT_CELLS, grid_alien_move_copy, "alien_moves"
                 )
                 if self.path is None:
-                    self.path = self.find_shortest_path(self.bot_moves, MOVEMENT_CELLS)
+                    self.path = self.find_path(self.bot_moves, MOVEMENT_CELLS)
                     if self.path is None:
                         self.idle_moves += 1
+            elif self.profile is not None:
+                self.profile.counters["replans_skipped"] += 1
 
             self.display_grid(LOG_DEBUG)
             if (self.path is not None) and (self.move_bot()):
@@ -851,65 +2449,108 @@ class Bot_3(Bot_2):
 """### BOT 4"""
 
 class Bot_4(Bot_3):
+    has_path_length_rule = True
+
     def __init__(self, ship, constraints, log_level=LOG_INFO):
         super(Bot_4, self).__init__(ship, constraints, log_level)
         self.is_escape_path = False
+        self.safe_moves = 0
 
-    def clone_grid_with_alien_moves(self):
-        clone_grid = np.copy(self.local_grid)
+    def alien_move_cells(self):
+        return MOVEMENT_CELLS | BOT_CELL
 
-        for alien in self.alien_cells:
-            adj_cells = get_neighbors(
-                self.row_size,
-                self.column_size,
-                alien,
-                MOVEMENT_CELLS | BOT_CELL,
-                self.local_grid,
-            )
-            for cell in adj_cells:
-                if clone_grid[cell] & OPEN_CELL:
-                    clone_grid[cell] = MOVED_ALIEN_CELL
-                elif clone_grid[cell] & CAPTAIN_CELL:
-                    clone_grid[cell] = MOVED_ALIEN_CAPTAIN_CELL
-                else:
-                    clone_grid[cell] = BOT_CAUGHT_CELL
+    def is_add_neighbor(self, grid_copy, neighbor_index, path_length):
+        ## BOT 4 V2 Logic, no alien or alien move within the first five steps
+        if path_length < 6 and self.alien_distance_map()[neighbor_index] <= 1:
+            return False
 
-        return clone_grid
+        return super(Bot_4, self).is_add_neighbor(
+            grid_copy, neighbor_index, path_length
+        )
 
-    def is_add_neighbor(self, grid_copy, neighbor, path_traversed):
-        ## BOT 4 V2 Logic
-        if len(path_traversed) < 6 and grid_copy[neighbor] & (
-            ALL_ALIEN_CELLS | MOVED_ALIEN_CELL | MOVED_ALIEN_CAPTAIN_CELL
-        ):
-            return False
+    """
+        Returns the no of alien moves after which an alien may be in every
+        flattened cell index, horizon + 1 if none can within the horizon.
+        Every step dilates the cells aliens may be in by one move, aliens may
+        also stay, so the cells only ever grow.
+    """
 
-        return super(Bot_4, self).is_add_neighbor(grid_copy, neighbor, path_traversed)
+    def alien_arrival_times(self, horizon):
+        alien_arrival = np.full(self.local_grid.shape, horizon + 1, dtype=np.int32)
+        alien_walkable = (self.local_grid & (ALIEN_MOVEMENT_CELLS | ALL_ALIEN_CELLS)) != 0
+        alien_reach = (self.local_grid & ALL_ALIEN_CELLS) != 0
+        for alien_moves in range(horizon + 1):
+            alien_arrival[alien_reach & (alien_arrival > alien_moves)] = alien_moves
+            alien_reach = (alien_reach | get_adjacent_cells(alien_reach)) & alien_walkable
+        return array("i", alien_arrival.tobytes())
 
-    def is_recalculate_path(self):
+    """
+        Space-time A* over (cell, t) states, t being the no of bot moves: a
+        cell can only be entered at t if no alien can be in it after t alien
+        moves, for the first space_time_horizon moves. The alien cells only
+        grow with t and the bot never waits, so reaching a cell earlier is
+        never worse and the search keeps a single state per cell.
+
+        Whatever the aliens do, the first moves of the plan cannot get the
+        bot caught, so it is followed for up to space_time_horizon turns
+        without searching again. Returns None if disabled or no such plan
+        exists.
+    """
+
+    def find_space_time_path(self, itr_count):
+        horizon = self.constraints.space_time_horizon
+        if horizon == -1:
+            return None
+
+        path = self.find_best_first_path(
+            itr_count,
+            RESCUE_PATH | ALIEN_CELL,
+            self.local_grid,
+            self.alien_arrival_times(horizon),
+        )
+        if path is not None:
+            self.safe_moves = min(horizon, len(path) - 1) - 1
+        return path
+
+    def find_fallback_path(self):
+        grid_alien_move_copy = self.clone_grid_with_alien_moves()
+
+        ## BOT 4 V1 Logic
+        # self.path = self.find_shortest_path(
+        #     self.bot_moves, MOVEMENT_CELLS, grid_alien_move_copy
+        # )
+
+        ## BOT 4 V2 Logic
+        self.path = self.find_path(
+            self.bot_moves, RESCUE_PATH | MOVED_ALIEN_CAPTAIN_CELL | MOVED_ALIEN_CELL | ALIEN_CELL, grid_alien_move_copy, "alien_moves"
+        )
         if self.path is None:
+            self.path = self.escape_nearby_aliens(
+                self.bot_moves, grid_alien_move_copy
+            )
+            if self.path is None:
+                self.idle_moves += 1  # Sit and pray
+            else:
+                self.is_escape_path = True
+
+    def is_recalculate_path(self):
+        if self.path is None or self.is_path_exhausted():
             return True
 
         is_cap_next_pos = self.path_pos + 1
-        if (is_cap_next_pos > len(self.path)) and (
+        if (is_cap_next_pos < len(self.path)) and (
             self.local_grid[self.path[is_cap_next_pos]] & CAPTAIN_CELL
         ):
             return False
 
+        # next four moves should stay out of reach of the aliens
+        alien_distance = self.alien_distance_map()
         for itr in range(1, 5, 1):
-            next_pos = self.path_pos + 1
-            if next_pos < len(self.path):
-                if self.path[next_pos] in self.alien_cells:
-                    return True
-
-                adj_cells_for_next_move = get_neighbors(
-                    self.row_size,
-                    self.column_size,
-                    self.path[next_pos],
-                    ALL_ALIEN_CELLS,
-                    self.local_grid,
-                )
-                if adj_cells_for_next_move in self.alien_cells:
-                    return True
+            next_pos = self.path_pos + itr
+            if next_pos >= len(self.path):
+                break
+            if alien_distance[self.cell_index(self.path[next_pos])] <= 1:
+                return True
 
         return False
 
@@ -919,31 +2560,19 @@ class Bot_4(Bot_3):
             if self.is_stop_search():
                 break
 
-            if (
+            if self.safe_moves:
+                self.safe_moves -= 1
+            elif (
                 (not self.constraints.reduce_search_frequenzy)
                 or self.is_escape_path
                 or self.is_recalculate_path()
             ):
                 self.is_escape_path = False
-                grid_alien_move_copy = self.clone_grid_with_alien_moves()
-
-                ## BOT 4 V1 Logic
-                # self.path = self.find_shortest_path(
-                #     self.bot_moves, MOVEMENT_CELLS, grid_alien_move_copy
-                # )
-
-                ## BOT 4 V2 Logic
-                self.path = self.find_shortest_path(
-                    self.bot_moves, RESCUE_PATH | MOVED_ALIEN_CAPTAIN_CELL | MOVED_ALIEN_CELL | ALIEN_CELL, grid_alien_move_copy
-                )
+                self.path = self.find_space_time_path(self.bot_moves)
                 if self.path is None:
-                    self.path = self.escape_nearby_aliens(
-                        self.bot_moves, grid_alien_move_copy
-                    )
-                    if self.path is None:
-                        self.idle_moves += 1  # Sit and pray
-                    else:
-                        self.is_escape_path = True
+                    self.find_fallback_path()
+            elif self.profile is not None:
+                self.profile.counters["replans_skipped"] += 1
 
             self.display_grid(LOG_DEBUG)
 
@@ -956,51 +2585,332 @@ class Bot_4(Bot_3):
 
         self.print_rescue_output()
 
-"""## MAIN"""
+"""### ENSEMBLE SIMULATOR
 
-ship = Ship(30, 10)
-ship.generate_grid()
-ship.place_players()
-# constraints = Constraints()
-constraints = Constraints(
-    int(len(ship.player_cells) * 2 / 3),
-    int(ship.grid.shape[0] * ship.grid.shape[1] * 0.8),
-    -1,
-    True,
-)
+    Bot_1 rollouts of many ships of the same size and alien count at once.
+    The B grids are one (B, row_size * column_size + 1) array, the extra
+    last cell is an always closed cell every missing neighbor points to, and
+    every tick moves the bot and the aliens of all running episodes with
+    array operations, following the same rules as Bot_1 and move_aliens.
 
-ship.show_grid()
-show_color_grid(ship.grid)
-print(f"bot position {ship.start}\tcaptain position {ship.goal}")
-print(
-    f"distance = {np.sqrt((ship.start[0] - ship.goal[0])**2 + (ship.start[1]-ship.goal[1])**2)}"
-)
+    Aliens still move one after the other in a random order per episode, so
+    two aliens never step onto the same cell, but the n'th alien of every
+    episode moves in the same array operation.
+"""
+
+class Ensemble_Simulator:
+    def __init__(self, ships, paths, bot_max_moves, rng):
+        row_size, column_size = ships[0].grid.shape
+        total_cells = row_size * column_size
+        self.batch_size = len(ships)
+        self.rng = rng
+        self.grids = np.full((self.batch_size, total_cells + 1), CLOSED_CELL, dtype=np.int16)
+        self.grids[:, :total_cells] = np.stack([ship.grid.reshape(-1) for ship in ships])
+
+        # the ships have different layouts, so the table only holds the
+        # grid bounds and closed cells are ruled out by the grids
+        self.neighbors = np.vstack((
+            get_grid_neighbors(row_size, column_size),
+            np.full((1, 4), total_cells, dtype=np.int32),
+        ))
+
+        self.alien_cells = np.array(
+            [[row * column_size + col for row, col in ship.alien_cells] for ship in ships],
+            dtype=np.intp,
+        ).reshape(self.batch_size, ships[0].no_of_aliens)
+
+        # paths - flattened cells, padded with the last cell of each path
+        path_length = max((len(path) for path in paths if path is not None), default=1)
+        self.paths = np.zeros((self.batch_size, path_length), dtype=np.intp)
+        self.flags = np.full(self.batch_size, FINDING_PATH_FLAG)
+        for itr, path in enumerate(paths):
+            if path is None:
+                self.flags[itr] = NO_PATH_FOUND_FLAG
+                continue
+            path = [row * column_size + col for row, col in path]
+            self.paths[itr, : len(path)] = path
+            self.paths[itr, len(path) :] = path[-1]
+
+        self.bot_cells = self.paths[:, 0].copy()
+        self.path_pos = np.zeros(self.batch_size, dtype=np.intp)
+        self.bot_moves = np.zeros(self.batch_size, dtype=np.intp)
+        self.bot_max_moves = np.asarray(bot_max_moves)
+
+    def move_bots(self, is_running):
+        batch = np.flatnonzero(is_running)
+        self.path_pos[batch] += 1
+        next_cells = self.paths[batch, self.path_pos[batch]]
+        next_values = self.grids[batch, next_cells]
+
+        is_caught = (next_values & (ALIEN_CELL | CAPTAIN_ALIEN_CELL)) != 0
+        is_goal = ~is_caught & ((next_values & CAPTAIN_CELL) != 0)
+        self.grids[batch, next_cells] = np.where(
+            is_caught, BOT_CAUGHT_CELL, np.where(is_goal, BOT_SUCCESS_CELL, BOT_CELL)
+        )
+        self.grids[batch, self.bot_cells[batch]] = OPEN_CELL
+        self.bot_cells[batch] = next_cells
+        self.flags[batch[is_caught]] = BOT_CAUGHT_FLAG
+        self.flags[batch[is_goal]] = GOAL_REACHED_FLAG
+
+    def move_aliens(self, is_running):
+        total_aliens = self.alien_cells.shape[1]
+        if not total_aliens:
+            return
+
+        alien_order = np.argsort(self.rng.random((self.batch_size, total_aliens)), axis=1)
+        for itr in range(total_aliens):
+            batch = np.flatnonzero(is_running)
+            if not batch.size:
+                break
+
+            alien_slots = alien_order[batch, itr]
+            aliens = self.alien_cells[batch, alien_slots]
+            neighbors = self.neighbors[aliens]
+            is_move = (self.grids[batch[:, None], neighbors] & ALIEN_MOVEMENT_CELLS) != 0
+            move_count = is_move.sum(axis=1)
+            move_choice = (self.rng.random(batch.size) * move_count).astype(np.intp)
+            move_column = (np.cumsum(is_move, axis=1) > move_choice[:, None]).argmax(axis=1)
+
+            has_move = move_count > 0
+            batch = batch[has_move]
+            alien_slots = alien_slots[has_move]
+            aliens = aliens[has_move]
+            new_cells = neighbors[has_move, move_column[has_move]]
+            new_values = self.grids[batch, new_cells]
+
+            is_caught = (new_values & BOT_CELL) != 0
+            is_captain = ~is_caught & ((new_values & CAPTAIN_CELL) != 0)
+            is_leaving_captain = (
+                ~is_caught & ~is_captain & ((self.grids[batch, aliens] & CAPTAIN_ALIEN_CELL) != 0)
+            )
+            self.grids[batch, aliens] = np.where(is_leaving_captain, CAPTAIN_CELL, OPEN_CELL)
+            self.grids[batch, new_cells] = np.where(
+                is_caught,
+                BOT_CAUGHT_CELL,
+                np.where(is_captain, CAPTAIN_ALIEN_CELL, ALIEN_CELL),
+            )
+            self.alien_cells[batch, alien_slots] = new_cells
+            self.flags[batch[is_caught]] = BOT_CAUGHT_FLAG
+            is_running[batch[is_caught]] = False
+
+    """
+        Runs every episode to its end and returns the final flag of each,
+        GOAL_REACHED_FLAG, BOT_CAUGHT_FLAG, NO_MOVES_LEFT_FLAG or
+        NO_PATH_FOUND_FLAG.
+    """
+
+    def run(self):
+        while True:
+            is_running = self.flags == FINDING_PATH_FLAG
+            if not is_running.any():
+                break
+
+            self.bot_moves[is_running] += 1
+            is_stuck = is_running & (self.bot_moves > self.bot_max_moves)
+            self.flags[is_stuck] = NO_MOVES_LEFT_FLAG
+            is_running &= ~is_stuck
+
+            self.move_bots(is_running)
+            is_running &= self.flags == FINDING_PATH_FLAG
+            self.move_aliens(is_running)
+
+        return self.flags
+
+"""### EPISODE TRACES
+
+    A bot with an Episode_Trace set records the bot and alien cells at the
+    start of every turn, and the final ones, as flattened cell indices into
+    arrays sized for bot_max_moves up front. Trace_Recorder saves the
+    traces of a batch of episodes to one compressed file and
+    Trace_Replayer rebuilds the grid of any turn from it, so a failed
+    episode can be looked at without running it again with LOG_DEBUG.
+
+    Aliens are kept in the order they moved in on that turn, not by
+    identity.
+"""
+
+class Episode_Trace:
+    def __init__(self, bot):
+        total_cells = bot.row_size * bot.column_size
+        cell_dtype = np.int16 if total_cells <= np.iinfo(np.int16).max else np.int32
+        # a stop check per move allowed, one more that stops it and the end
+        max_turns = bot.constraints.bot_max_moves + 2
+        self.layout = np.where(
+            bot.local_grid == CLOSED_CELL, CLOSED_CELL, OPEN_CELL
+        ).astype(np.uint8)
+        self.captain_cell = bot.cell_index(bot.captain_cell)
+        self.bot_cells = np.zeros(max_turns, dtype=cell_dtype)
+        self.alien_cells = np.zeros((max_turns, len(bot.alien_cells)), dtype=cell_dtype)
+        self.turns = 0
+        self.flag = FINDING_PATH_FLAG
+
+    def record(self, bot):
+        self.bot_cells[self.turns] = bot.cell_index(bot.curr_pos)
+        if bot.alien_cells:
+            alien_cells = np.array(bot.alien_cells, dtype=np.intp)
+            self.alien_cells[self.turns] = alien_cells[:, 0] * bot.column_size + alien_cells[:, 1]
+        self.turns += 1
+
+    def finish(self, bot):
+        self.record(bot)
+        self.flag = bot.flag
+
+class Trace_Recorder:
+    def __init__(self):
+        # episodes - [ ((alien_count, run_index, constraint_id, bot_id), Episode_Trace) ]
+        self.episodes = []
+
+    def add(self, key, trace):
+        self.episodes.append((key, trace))
+
+    """
+        Saves every episode into one compressed npz, the turns of all
+        episodes concatenated and split by turn_offsets, the aliens of a
+        turn flattened and split by alien_offsets.
+    """
+
+    def save(self, path):
+        traces = [trace for _, trace in self.episodes]
+        turn_counts = [trace.turns for trace in traces]
+        alien_counts = [trace.alien_cells.shape[1] for trace in traces]
+        np.savez_compressed(
+            path,
+            keys=np.array([key for key, _ in self.episodes], dtype=np.int32).reshape(-1, 4),
+            layouts=np.array([trace.layout for trace in traces]),
+            captain_cells=np.array([trace.captain_cell for trace in traces], dtype=np.int32),
+            flags=np.array([trace.flag for trace in traces], dtype=np.int8),
+            turn_offsets=np.concatenate(([0], np.cumsum(turn_counts))).astype(np.int64),
+            alien_offsets=np.concatenate(
+                ([0], np.cumsum(np.multiply(turn_counts, alien_counts)))
+            ).astype(np.int64),
+            alien_counts=np.array(alien_counts, dtype=np.int32),
+            bot_cells=np.concatenate([trace.bot_cells[: trace.turns] for trace in traces]),
+            alien_cells=np.concatenate(
+                [trace.alien_cells[: trace.turns].reshape(-1) for trace in traces]
+            ),
+        )
+
+    """
+        Saves to path_prefix.npz, or path_prefix_<n>.npz with the first free
+        n if that is taken, e.g. by the earlier part of a resumed sweep.
+    """
+
+    def save_new(self, path_prefix):
+        path = path_prefix + '.npz'
+        file_no = 0
+        while os.path.exists(path):
+            file_no += 1
+            path = f'{path_prefix}_{file_no}.npz'
+        self.save(path)
+        return path
+
+class Trace_Replayer:
+    def __init__(self, path):
+        with np.load(path) as data:
+            self.data = {name: data[name] for name in data.files}
+        self.keys = self.data['keys']
+
+    def __len__(self):
+        return len(self.keys)
+
+    """
+        Index of the episode of the given run, constraint level and bot no,
+        None if the file has no such episode.
+    """
+
+    def find_episode(self, alien_count, run_index, constraint_level, bot_no):
+        key = (alien_count, run_index, ALL_CONSTRAINTS.index(constraint_level), ALL_BOTS.index(bot_no))
+        matches = np.flatnonzero((self.keys == key).all(axis=1))
+        return int(matches[0]) if len(matches) else None
 
-bot1 = Bot_1(ship, constraints)
-bot1.start_rescue()
+    def turn_count(self, episode):
+        turn_offsets = self.data['turn_offsets']
+        return int(turn_offsets[episode + 1] - turn_offsets[episode])
 
-bot2 = Bot_2(ship, constraints)
-bot2.start_rescue()
+    def alien_cells(self, episode, turn):
+        alien_count = self.data['alien_counts'][episode]
+        start = self.data['alien_offsets'][episode] + turn * alien_count
+        return self.data['alien_cells'][start : start + alien_count]
 
-bot3 = Bot_3(ship, constraints)
-bot3.start_rescue()
+    def bot_cell(self, episode, turn):
+        return self.data['bot_cells'][self.data['turn_offsets'][episode] + turn]
 
-bot4 = Bot_4(ship, constraints)
-bot4.start_rescue()
+    """
+        Rebuilds the grid of the episode at the start of the given turn, the
+        last turn being its final state with the bot cell marked as caught
+        or successful.
+    """
+
+    def grid(self, episode, turn=-1):
+        turn_count = self.turn_count(episode)
+        if turn < 0:
+            turn += turn_count
+        grid = self.data['layouts'][episode].astype(int)
+        flat_grid = grid.reshape(-1)
+        flat_grid[self.data['captain_cells'][episode]] = CAPTAIN_CELL
+        aliens = self.alien_cells(episode, turn)
+        flat_grid[aliens] = np.where(
+            flat_grid[aliens] == CAPTAIN_CELL, CAPTAIN_ALIEN_CELL, ALIEN_CELL
+        )
 
-del bot4
-del bot3
-del bot2
-del bot1
-del constraints
-del ship
+        bot_cell_type = BOT_CELL
+        if turn == turn_count - 1:
+            flag = self.data['flags'][episode]
+            if flag == GOAL_REACHED_FLAG:
+                bot_cell_type = BOT_SUCCESS_CELL
+            elif flag == BOT_CAUGHT_FLAG:
+                bot_cell_type = BOT_CAUGHT_CELL
+        flat_grid[self.bot_cell(episode, turn)] = bot_cell_type
+        return grid
+
+"""## MAIN"""
+
+if __name__ == "__main__":
+    ship = Ship(30, 10)
+    ship.generate_grid()
+    ship.place_players()
+    # constraints = Constraints()
+    constraints = Constraints(
+        int(len(ship.player_cells) * 2 / 3),
+        int(ship.grid.shape[0] * ship.grid.shape[1] * 0.8),
+        -1,
+        True,
+    )
+
+    ship.show_grid()
+    show_color_grid(ship.grid)
+    print(f"bot position {ship.start}\tcaptain position {ship.goal}")
+    print(
+        f"distance = {np.sqrt((ship.start[0] - ship.goal[0])**2 + (ship.start[1]-ship.goal[1])**2)}"
+    )
+
+    bot1 = Bot_1(ship, constraints)
+    bot1.start_rescue()
+
+    bot2 = Bot_2(ship, constraints)
+    bot2.start_rescue()
+
+    bot3 = Bot_3(ship, constraints)
+    bot3.start_rescue()
+
+    bot4 = Bot_4(ship, constraints)
+    bot4.start_rescue()
+
+    del bot4
+    del bot3
+    del bot2
+    del bot1
+    del constraints
+    del ship
 
 """#PLOTTING THE DATA
 
 ## IMPORTS
 """
 
+import json
 import sys
+from multiprocessing import Pool, cpu_count
 
 """## CONSTANTS"""
 
@@ -1010,6 +2920,12 @@ TOTAL_RUNS = 250
 GRID_SIZE = 10
 INITIAL_ALIENS = 0
 ALIEN_INC_COUNT = 3
+SIMULATION_SEED = 0
+MAX_CORES = cpu_count()
+SAMPLE_BATCH_SIZE = 50
+CONFIDENCE_Z = 1.96 # 95% confidence
+SUCCESS_RATE_TOLERANCE = 0.05 # half width of the success rate interval
+RESULTS_LOG_DIR = 'results_log'
 
 CONSTRAINT_LEVELS = {
     0: 'no_constraints',
@@ -1029,6 +2945,13 @@ BOT_NOS = {
 
 ALL_BOTS = list(BOT_NOS.values())
 
+NO_OUTCOME = -1
+OUTCOME_CODES = {
+    BOT_FAILURE: 0,
+    BOT_SUCCESS: 1,
+    BOT_STUCK: 2,
+}
+
 """## BOT FACTORY"""
 
 def constraints_factory(constraint_levels, ship):
@@ -1039,15 +2962,15 @@ def constraints_factory(constraint_levels, ship):
         constraints.append(Constraints(-1, max_moves_allowed))  # No constraints,
     if CONSTRAINT_LEVELS[1] in constraint_levels:
         constraints.append(Constraints(
-            int(open_cells * 0.8), int(max_moves_allowed * 0.04), -1, True
+            int(open_cells * 0.8), int(max_moves_allowed * 0.04), -1, True, SEARCH_MEMORY_BOUNDED
         ))  # max queue size is capped at 80% the number of available cells
     if CONSTRAINT_LEVELS[2] in constraint_levels:
         constraints.append(Constraints(
-            int(open_cells * 2 / 3), int(max_moves_allowed * 0.025), -1, True
+            int(open_cells * 2 / 3), int(max_moves_allowed * 0.025), -1, True, SEARCH_MEMORY_BOUNDED
         ))  # capped at 66.6667%
     if CONSTRAINT_LEVELS[3] in constraint_levels:
         constraints.append(Constraints(
-            int(open_cells * 0.5), int(max_moves_allowed * 0.1), -1, True
+            int(open_cells * 0.5), int(max_moves_allowed * 0.1), -1, True, SEARCH_MEMORY_BOUNDED
         ))  # capped to 50%
     return constraints
 
@@ -1101,86 +3024,687 @@ def execute_bot(bot, bot_no, constraint_level):
             e,
             file=sys.stderr,
         )
-        sys.exit(0)
-        return BOT_FAILURE
+        raise
     finally:
         del bot
 
 
-def run_simulations(bot_nos, constraint_levels):
-    alien_count = INITIAL_ALIENS
+"""
+    Seed of one simulation task, derived from (alien_count, run_index) only,
+    so a task plays out the same whichever worker runs it and in any order.
+"""
+
+def task_seed(alien_count, run_index, *episode):
+    return int(
+        np.random.SeedSequence((SIMULATION_SEED, alien_count, run_index, *episode)).generate_state(1)[0]
+    )
+
+"""
+    Fixed set of ship_count BonusShipV2 layouts of one grid size, generated
+    once under corpus_dir and loaded by index, so that every sweep,
+    constraint level and bot version is run on the very same ships.
+
+    layouts.npy - (ship_count, grid_size, grid_size) uint8 cell codes
+    placements_<alien_count>.npy - (ship_count, 2 + alien_count) int32
+        flattened bot, captain and alien cells on every layout
+
+    Both are memory mapped. A layout is seeded by its index and the
+    placements on it by task_seed, so a corpus comes out the same wherever
+    it is built. Placements for an alien count are made the first time it
+    is asked for, and every file is written whole before being renamed in.
+"""
+
+class Ship_Corpus:
+    # opened - { corpus_dir: Ship_Corpus } of this process
+    opened = {}
+
+    def __init__(self, corpus_dir, grid_size=GRID_SIZE, ship_count=TOTAL_RUNS):
+        self.corpus_dir = corpus_dir
+        layout_path = os.path.join(corpus_dir, 'layouts.npy')
+        if not os.path.exists(layout_path):
+            os.makedirs(corpus_dir, exist_ok=True)
+            self.generate_layouts(layout_path, grid_size, ship_count)
+        self.layouts = np.load(layout_path, mmap_mode='r')
+        self.ship_count, self.grid_size, _ = self.layouts.shape
+        if self.grid_size != grid_size:
+            raise ValueError(
+                f"{corpus_dir} holds ships of grid size {self.grid_size}, not {grid_size}, use another corpus_dir"
+            )
+        self.placement_sets = {}
+
+    """
+        Corpus under corpus_dir, opened once per process and kept, so tasks
+        don't map its files again for every ship.
+    """
+
+    @classmethod
+    def open(cls, corpus_dir):
+        if corpus_dir not in cls.opened:
+            cls.opened[corpus_dir] = cls(corpus_dir)
+        return cls.opened[corpus_dir]
+
+    def generate_layouts(self, layout_path, grid_size, ship_count):
+        temp_path = layout_path + '.tmp.npy'
+        layouts = np.lib.format.open_memmap(
+            temp_path, mode='w+', dtype=np.uint8, shape=(ship_count, grid_size, grid_size)
+        )
+        for index in range(ship_count):
+            seed = int(
+                np.random.SeedSequence(SIMULATION_SEED, spawn_key=(grid_size, index)).generate_state(1)[0]
+            )
+            random.seed(seed)
+            np.random.seed(seed)
+            ship = BonusShipV2(grid_size, 0)
+            ship.generate_grid()
+            layouts[index] = ship.grid
+        layouts.flush()
+        del layouts
+        os.replace(temp_path, layout_path)
+
+    def placements(self, alien_count):
+        if alien_count not in self.placement_sets:
+            placement_path = os.path.join(self.corpus_dir, f'placements_{alien_count}.npy')
+            if not os.path.exists(placement_path):
+                self.generate_placements(placement_path, alien_count)
+            self.placement_sets[alien_count] = np.load(placement_path, mmap_mode='r')
+        return self.placement_sets[alien_count]
+
+    def generate_placements(self, placement_path, alien_count):
+        placements = np.zeros((self.ship_count, 2 + alien_count), dtype=np.int32)
+        for index in range(self.ship_count):
+            seed = task_seed(alien_count, index)
+            random.seed(seed)
+            np.random.seed(seed)
+            ship = self.load_layout(index, alien_count)
+            ship.place_players()
+            placements[index] = [
+                cell[0] * ship.column_size + cell[1]
+                for cell in [ship.bot_cell, ship.captain_cell, *ship.alien_cells]
+            ]
+        temp_path = placement_path + '.tmp.npy'
+        np.save(temp_path, placements)
+        os.replace(temp_path, placement_path)
+
+    def load_layout(self, index, alien_count):
+        ship = BonusShipV2(self.grid_size, alien_count)
+        ship.load_layout(self.layouts[index])
+        return ship
+
+    """
+        Ship on layout run_index % ship_count with the players of
+        alien_count placed, ready for a bot.
+    """
+
+    def load_ship(self, alien_count, run_index):
+        index = run_index % self.ship_count
+        placement = self.placements(alien_count)[index]
+        ship = self.load_layout(index, alien_count)
+        ship.load_players(placement[0], placement[1], placement[2:])
+        return ship
+
+"""
+    Seeds the task and builds its ship, loaded from the Ship_Corpus under
+    corpus_dir if one is given, else generated from the task seed.
+"""
+
+def build_ship(alien_count, run_index, corpus_dir=None):
+    seed = task_seed(alien_count, run_index)
+    random.seed(seed)
+    np.random.seed(seed)
+    if corpus_dir is not None:
+        return Ship_Corpus.open(corpus_dir).load_ship(alien_count, run_index)
+
+    ship = BonusShipV2(GRID_SIZE, alien_count)
+    ship.generate_grid()
+    ship.place_players()
+    return ship
+
+"""
+    Runs every active constraint level and bot on one ship. Each episode
+    is seeded by task_seed of its (run, constraint, bot), so an outcome is
+    the same whether or not the other cells of the run are run with it.
+
+    Parameters
+    ----------
+    task - tuple
+        (alien_count, run_index, bot_nos, constraint_levels, is_active,
+        corpus_dir, is_traced, is_profiled), is_active being the
+        (constraint, bot) cells still to be run
+
+    Returns
+    ----------
+    tuple
+        alien_count, run_index, the (constraint, bot) matrix of
+        OUTCOME_CODES, NO_OUTCOME for the cells that were not run, the
+        Trace_Recorder episodes of the run if is_traced, else [], and the
+        [ ((bot_no, constraint_level), Bot_Profile) ] of the run if
+        is_profiled, else []
+"""
+
+def run_simulation_task(task):
+    alien_count, run_index, bot_nos, constraint_levels, is_active, corpus_dir, is_traced, is_profiled = task
+    outcomes = np.full((len(constraint_levels), len(bot_nos)), NO_OUTCOME, dtype=np.int8)
+    traces = []
+    profiles = []
+    ship = build_ship(alien_count, run_index, corpus_dir)
+
+    constraints_set = constraints_factory(constraint_levels, ship)
+    for itrc, constraints in enumerate(constraints_set):
+        active_bots = np.flatnonzero(is_active[itrc])
+        if not len(active_bots):
+            continue
+
+        bots = bots_factory([bot_nos[itrb] for itrb in active_bots], ship, constraints)
+        for itrb, bot in zip(active_bots, bots):
+            if is_traced:
+                bot.trace = Episode_Trace(bot)
+                traces.append((
+                    (alien_count, run_index, ALL_CONSTRAINTS.index(constraint_levels[itrc]), ALL_BOTS.index(bot_nos[itrb])),
+                    bot.trace,
+                ))
+            if is_profiled:
+                profiles.append(((bot_nos[itrb], constraint_levels[itrc]), Bot_Profile.install(bot)))
+            # seeded per episode, so its alien moves do not depend on which cells the task runs
+            seed = task_seed(
+                alien_count, run_index, ALL_CONSTRAINTS.index(constraint_levels[itrc]), ALL_BOTS.index(bot_nos[itrb])
+            )
+            random.seed(seed)
+            np.random.seed(seed)
+            status = execute_bot(bot, bot_nos[itrb], constraint_levels[itrc])
+            outcomes[itrc][itrb] = OUTCOME_CODES[status]
+        del constraints
+
+    del ship
+    return alien_count, run_index, outcomes, traces, profiles
+
+"""
+    Runs Bot_1 on the ships of all the given runs of one alien count at
+    once with the Ensemble_Simulator. The ships are the same ones
+    run_simulation_task builds for those runs, the alien moves come from
+    a generator of their own per (alien_count, first run).
+
+    Parameters
+    ----------
+    task - tuple
+        (alien_count, run_indices, constraint_levels, corpus_dir)
+
+    Returns
+    ----------
+    tuple
+        alien_count, run_indices and the (run, constraint, 1) matrix of
+        OUTCOME_CODES of Bot_1
+"""
+
+def run_ensemble_task(task):
+    alien_count, run_indices, constraint_levels, corpus_dir = task
+    ships = [build_ship(alien_count, run_index, corpus_dir) for run_index in run_indices]
+
+    rng = np.random.default_rng(
+        np.random.SeedSequence((SIMULATION_SEED, alien_count, run_indices[0]))
+    )
+    outcomes = np.full((len(ships), len(constraint_levels), 1), OUTCOME_CODES[BOT_FAILURE], dtype=np.int8)
+    # paths, bot_max_moves - [ [ value of each ship ], ... for every constraint level ]
+    paths = [[] for _ in constraint_levels]
+    bot_max_moves = [[] for _ in constraint_levels]
+    for ship in ships:
+        bot = Bot_1(ship, Constraints(), LOG_NONE)
+        for itrc, constraints in enumerate(constraints_factory(constraint_levels, ship)):
+            bot.constraints = constraints
+            paths[itrc].append(bot.find_shortest_path(0, RESCUE_PATH | ALIEN_CELL))
+            bot_max_moves[itrc].append(constraints.bot_max_moves)
+
+    for itrc in range(len(constraint_levels)):
+        flags = Ensemble_Simulator(ships, paths[itrc], bot_max_moves[itrc], rng).run()
+        outcomes[flags == GOAL_REACHED_FLAG, itrc, 0] = OUTCOME_CODES[BOT_SUCCESS]
+        outcomes[flags == NO_MOVES_LEFT_FLAG, itrc, 0] = OUTCOME_CODES[BOT_STUCK]
+
+    return alien_count, run_indices, outcomes
+
+"""
+    Append only columnar log of simulation outcomes, one binary file per
+    column under log_dir. A record is one (alien_count, run_index,
+    constraint, bot) outcome, constraint and bot being indices into
+    ALL_CONSTRAINTS and ALL_BOTS so that sweeps over any subset of them can
+    share a log. Records torn by a crash are dropped when it is reopened.
+
+    params - the sweep settings the outcomes depend on, kept in params.json
+        the first time the log is opened with them. Opening a log that
+        holds outcomes of other settings raises a ValueError rather than
+        mixing them, None skips the check (plotting only).
+"""
+
+class Results_Log:
+    COLUMNS = {
+        'alien_count': np.int16,
+        'run_index': np.int32,
+        'constraint': np.int8,
+        'bot': np.int8,
+        'outcome': np.int8,
+    }
+
+    def __init__(self, log_dir, params=None):
+        os.makedirs(log_dir, exist_ok=True)
+        paths = {name: os.path.join(log_dir, name + '.bin') for name in self.COLUMNS}
+        if params is not None:
+            self.check_params(log_dir, params, paths)
+        # whole records only, a torn write can leave part of one in any column
+        record_count = min(
+            os.path.getsize(paths[name]) // np.dtype(dtype).itemsize
+            if os.path.exists(paths[name]) else 0
+            for name, dtype in self.COLUMNS.items()
+        )
+        columns = {}
+        for name, dtype in self.COLUMNS.items():
+            if not os.path.exists(paths[name]):
+                columns[name] = np.zeros(0, dtype=dtype)
+                continue
+            if os.path.getsize(paths[name]) != record_count * np.dtype(dtype).itemsize:
+                os.truncate(paths[name], record_count * np.dtype(dtype).itemsize)
+            columns[name] = np.fromfile(paths[name], dtype=dtype, count=record_count)
+
+        # outcomes - { (alien_count, run_index): (all constraints, all bots) matrix }
+        self.outcomes = {}
+        for alien_count, run_index, constraint, bot, outcome in zip(
+            *(columns[name][:record_count].tolist() for name in self.COLUMNS)
+        ):
+            self.get_run(alien_count, run_index)[constraint][bot] = outcome
+
+        self.files = {name: open(paths[name], 'ab') for name in self.COLUMNS}
+
+    def check_params(self, log_dir, params, paths):
+        params_path = os.path.join(log_dir, 'params.json')
+        if os.path.exists(params_path):
+            with open(params_path) as params_file:
+                log_params = json.load(params_file)
+            if log_params != params:
+                raise ValueError(
+                    f"{log_dir} holds outcomes of a sweep with {log_params}, not {params}, use another log_dir"
+                )
+        elif any(os.path.exists(path) and os.path.getsize(path) for path in paths.values()):
+            raise ValueError(f"{log_dir} holds outcomes of a sweep with unknown settings, use another log_dir")
+        else:
+            with open(params_path + '.tmp', 'w') as params_file:
+                json.dump(params, params_file)
+            os.replace(params_path + '.tmp', params_path)
+
+    def get_run(self, alien_count, run_index):
+        key = (alien_count, run_index)
+        if key not in self.outcomes:
+            self.outcomes[key] = np.full(
+                (len(ALL_CONSTRAINTS), len(ALL_BOTS)), NO_OUTCOME, dtype=np.int8
+            )
+        return self.outcomes[key]
+
+    """
+        Recorded outcomes of one run, NO_OUTCOME where there are none, as a
+        (constraint, bot) matrix over the given ids.
+    """
+
+    def get_outcomes(self, alien_count, run_index, constraint_ids, bot_ids):
+        key = (alien_count, run_index)
+        if key not in self.outcomes:
+            return np.full((len(constraint_ids), len(bot_ids)), NO_OUTCOME, dtype=np.int8)
+        return self.outcomes[key][np.ix_(constraint_ids, bot_ids)]
+
+    """
+        Appends every outcome of one run that is not NO_OUTCOME and flushes
+        it to disk.
+    """
+
+    def append(self, alien_count, run_index, outcomes, constraint_ids, bot_ids):
+        itrc, itrb = np.nonzero(outcomes != NO_OUTCOME)
+        if not len(itrc):
+            return
+
+        constraints = np.asarray(constraint_ids)[itrc]
+        bots = np.asarray(bot_ids)[itrb]
+        values = outcomes[itrc, itrb]
+        self.get_run(alien_count, run_index)[constraints, bots] = values
+        record = {
+            'alien_count': np.full(len(values), alien_count),
+            'run_index': np.full(len(values), run_index),
+            'constraint': constraints,
+            'bot': bots,
+            'outcome': values,
+        }
+        for name, dtype in self.COLUMNS.items():
+            record[name].astype(dtype).tofile(self.files[name])
+        for file in self.files.values():
+            file.flush()
+
+    def alien_counts(self):
+        return sorted({alien_count for alien_count, _ in self.outcomes})
+
+    def run_indices(self, alien_count):
+        return sorted(itr for count, itr in self.outcomes if count == alien_count)
+
+    def close(self):
+        for file in self.files.values():
+            file.close()
+
+"""
+    Settings of this module an outcome of the sweep depends on, besides its
+    (alien_count, run_index, constraint, bot) key. The batch size sets the
+    ensemble runs of a generator, so it only counts with use_ensemble, and
+    the ships come from the Ship_Corpus if there is one.
+"""
+
+def sweep_params(use_ensemble, batch_size, ship_corpus=None):
+    return {
+        'grid_size': GRID_SIZE,
+        'seed': SIMULATION_SEED,
+        'max_moves': DEFAULT_MAX_MOVES,
+        'batch_size': batch_size if use_ensemble else None,
+        'use_ensemble': bool(use_ensemble),
+        'corpus_dir': None if ship_corpus is None else os.path.abspath(ship_corpus.corpus_dir),
+        'corpus_grid_size': None if ship_corpus is None else ship_corpus.grid_size,
+    }
+
+"""
+    Success, survival and failed counts with the no of runs of every
+    (constraint, bot) cell, over a (run, constraint, bot) matrix of
+    outcomes, only counting the cells of is_active.
+"""
+
+def count_outcomes(outcomes, is_active):
+    recorded = (outcomes != NO_OUTCOME) & is_active
+    success_count = np.sum(recorded & (outcomes == OUTCOME_CODES[BOT_SUCCESS]), axis=0)
+    survival_count = np.sum(recorded & (outcomes == OUTCOME_CODES[BOT_STUCK]), axis=0)
+    run_count = np.sum(recorded, axis=0)
+    return success_count, survival_count, run_count - success_count, run_count
+
+def compute_rates(success_count, survival_count, failed_count, run_count):
+    total_constraints, total_bots = success_count.shape
+    success_rate = np.zeros((total_constraints, total_bots))
+    survival_rate = np.zeros((total_constraints, total_bots))
+    for itrc in range(total_constraints):
+        for itrb in range(total_bots):
+            succeeded = success_count[itrc][itrb]
+            survived = survival_count[itrc][itrb]
+            failed = failed_count[itrc][itrb]
+
+            success_rate[itrc][itrb] = (succeeded / max(run_count[itrc][itrb], 1)) * 100
+            # if both are 0, proceed to set survival_rate 0
+            if not (survived and failed):
+                failed = 1
+            survival_rate[itrc][itrb] = survived / (survived + failed) * 100
+    return success_rate, survival_rate
+
+"""
+    Writes the summaries of the profiles of a sweep to profile_path as a
+    JSON list, and prints where the time of every (bot, constraint) went
+    over all alien counts.
+"""
+
+def save_profile_totals(profile_totals, profile_path):
+    with open(profile_path, 'w') as profile_file:
+        json.dump(
+            [
+                {'alien_count': alien_count, 'bot': bot_no, 'constraint': level, **bot_profile.summary()}
+                for (alien_count, bot_no, level), bot_profile in sorted(profile_totals.items())
+            ],
+            profile_file,
+            indent=2,
+        )
+
+    bot_totals = {}
+    for (_, bot_no, level), bot_profile in profile_totals.items():
+        bot_totals.setdefault((bot_no, level), Bot_Profile()).merge(bot_profile)
+    for (bot_no, level), bot_profile in sorted(bot_totals.items()):
+        counters = bot_profile.counters
+        phases = sorted(bot_profile.phase_times.items(), key=lambda phase: -phase[1])[:3]
+        print(
+            f'{bot_no} {level}: {counters["searches"]} searches, '
+            f'{counters["nodes_expanded"] / max(counters["searches"], 1):.0f} nodes per search, '
+            f'queue peak {bot_profile.queue_peak}, {counters["replans_skipped"]} replans skipped, '
+            f'{counters["idle_moves"]} idle moves, top phases '
+            + ', '.join(f'{phase} {phase_time / 1e6:.0f}ms' for phase, phase_time in phases)
+        )
+    print(f'Profile per alien count saved to {profile_path}')
+
+"""
+    Wilson score interval of the success rates of the given counts, at the
+    confidence of CONFIDENCE_Z.
+
+    Returns
+    ----------
+    tuple
+        low and high bounds, each the shape of success_count
+"""
+
+def wilson_interval(success_count, run_count):
+    run_count = np.maximum(run_count, 1)
+    rate = success_count / run_count
+    z_sq = CONFIDENCE_Z ** 2
+    denominator = 1 + z_sq / run_count
+    center = (rate + z_sq / (2 * run_count)) / denominator
+    half_width = CONFIDENCE_Z * np.sqrt(
+        rate * (1 - rate) / run_count + z_sq / (4 * run_count ** 2)
+    ) / denominator
+    return center - half_width, center + half_width
+
+"""
+    Splits the sweep into (alien_count, run_index) tasks and runs them on a
+    pool of core_count processes. Each alien count is sampled in batches of
+    SAMPLE_BATCH_SIZE runs when adaptive, else in one batch of TOTAL_RUNS;
+    the next batch is only decided on once the last one is done, so the
+    results are the same for any no of workers.
+
+    Every outcome is appended to the Results_Log under log_dir as soon as
+    its task is done, and outcomes already in it are not simulated again,
+    so an interrupted sweep picks up where it stopped when rerun. A log
+    written with other sweep_params is refused instead of resumed.
+
+    corpus_dir - runs every task on a ship of the Ship_Corpus there, built
+        with TOTAL_RUNS layouts if it does not exist yet, instead of a newly
+        generated one. The log then defaults to one inside the corpus, as
+        its outcomes do not mix with those of generated ships. A corpus of
+        another grid size than GRID_SIZE is refused.
+    trace_dir - saves the Episode_Trace of every bot run by a task, one
+        traces_<alien_count>_<batch_start>.npz per batch, for
+        Trace_Replayer. Ensemble runs are not traced.
+    profile - installs a Bot_Profile on every bot run by a task and adds
+        them up per (alien_count, bot, constraint) into profile.json in
+        log_dir, covering the runs of this call only. Ensemble runs are
+        not profiled.
+
+    use_ensemble - runs Bot_1 with one Ensemble_Simulator task per batch
+        instead, which is orders of magnitude faster for large TOTAL_RUNS
+    adaptive - stops sampling a (constraint, bot) cell once its success rate
+        is within SUCCESS_RATE_TOLERANCE at CONFIDENCE_Z, cells without a
+        success only once it is at most SUCCESS_RATE_TOLERANCE. The sweep
+        stops at the first alien count no cell has a success at, as the
+        rest would not either. TOTAL_RUNS stays the cap for a cell. Off by
+        default, every cell then gets TOTAL_RUNS runs at every alien count.
+"""
+
+def run_simulations(bot_nos, constraint_levels, core_count=MAX_CORES, use_ensemble=False, adaptive=False, log_dir=None, corpus_dir=None, trace_dir=None, profile=False):
     alien_count_set = []
     success_rate_set = {}
     survival_rate_set = {}
     total_constraints = len(constraint_levels)
     total_bots = len(bot_nos)
+    constraint_ids = [ALL_CONSTRAINTS.index(level) for level in constraint_levels]
+    bot_ids = [ALL_BOTS.index(bot_no) for bot_no in bot_nos]
 
     alien_count_limit = np.zeros((total_constraints, total_bots))
     alien_limit_set =  np.zeros((total_constraints, total_bots))
+    max_half_width = 0
+    # profile_totals - { (alien_count, bot_no, constraint_level): Bot_Profile }
+    profile_totals = {}
+
+    ensemble_columns = []
+    if use_ensemble and BOT_NOS[1] in bot_nos:
+        ensemble_columns = [bot_nos.index(BOT_NOS[1])]
+    task_columns = [
+        itrb for itrb in range(total_bots) if itrb not in ensemble_columns
+    ]
+    task_bots = [bot_nos[itrb] for itrb in task_columns]
+
+    ship_corpus = None
+    if corpus_dir is not None:
+        ship_corpus = Ship_Corpus(corpus_dir, GRID_SIZE, TOTAL_RUNS)
+    if log_dir is None:
+        log_dir = RESULTS_LOG_DIR if corpus_dir is None else os.path.join(corpus_dir, RESULTS_LOG_DIR)
+
+    if trace_dir is not None:
+        os.makedirs(trace_dir, exist_ok=True)
+
+    # batches only split the runs to decide on the next one
+    batch_size = SAMPLE_BATCH_SIZE if adaptive else TOTAL_RUNS
+    results_log = Results_Log(log_dir, sweep_params(use_ensemble, batch_size, ship_corpus))
+    chunk_size = max(1, batch_size // (core_count * 4))
+    try:
+        with Pool(processes=core_count) as p:
+            for alien_count in range(INITIAL_ALIENS, MAX_ALIEN_LIMIT + 1, ALIEN_INC_COUNT):
+                success_count = np.zeros((total_constraints, total_bots))
+                survival_count = np.zeros((total_constraints, total_bots))
+                failed_count = np.zeros((total_constraints, total_bots))
+                run_count = np.zeros((total_constraints, total_bots))
+                is_active = np.ones((total_constraints, total_bots), dtype=bool)
+                if ship_corpus is not None:
+                    ship_corpus.placements(alien_count) # made once here, before the workers read it
+
+                for batch_start in range(0, TOTAL_RUNS, batch_size):
+                    run_indices = range(batch_start, min(batch_start + batch_size, TOTAL_RUNS))
+                    batch_outcomes = np.array([
+                        results_log.get_outcomes(alien_count, itr, constraint_ids, bot_ids)
+                        for itr in run_indices
+                    ])
+                    is_missing = (batch_outcomes == NO_OUTCOME) & is_active
+
+                    ensemble_result = None
+                    if ensemble_columns and is_missing[:, :, ensemble_columns].any():
+                        ensemble_result = p.apply_async(
+                            run_ensemble_task, ((alien_count, run_indices, constraint_levels, corpus_dir),)
+                        )
+
+                    tasks = [
+                        (alien_count, itr, task_bots, constraint_levels, is_missing[itr - batch_start][:, task_columns], corpus_dir, trace_dir is not None, profile)
+                        for itr in run_indices
+                        if is_missing[itr - batch_start][:, task_columns].any()
+                    ]
+                    trace_recorder = Trace_Recorder()
+                    for itr, (_, run_index, task_outcomes, traces, profiles) in enumerate(
+                        p.imap_unordered(run_simulation_task, tasks, chunk_size)
+                    ):
+                        for key, trace in traces:
+                            trace_recorder.add(key, trace)
+                        for (bot_no, level), bot_profile in profiles:
+                            profile_totals.setdefault(
+                                (alien_count, bot_no, level), Bot_Profile()
+                            ).merge(bot_profile)
+                        print('Roomba is trying to save for the %d\'th time. Imagine evading %d aliens.' % (batch_start + itr, alien_count), end='\r')
+                        outcomes = np.full((total_constraints, total_bots), NO_OUTCOME, dtype=np.int8)
+                        outcomes[:, task_columns] = task_outcomes
+                        results_log.append(alien_count, run_index, outcomes, constraint_ids, bot_ids)
+                        batch_outcomes[run_index - batch_start] = np.where(
+                            outcomes != NO_OUTCOME, outcomes, batch_outcomes[run_index - batch_start]
+                        )
+
+                    if trace_recorder.episodes:
+                        trace_recorder.save_new(
+                            os.path.join(trace_dir, f'traces_{alien_count}_{batch_start}')
+                        )
+
+                    if ensemble_result is not None:
+                        _, _, ensemble_outcomes = ensemble_result.get()
+                        for itr, run_index in enumerate(run_indices):
+                            outcomes = np.full((total_constraints, total_bots), NO_OUTCOME, dtype=np.int8)
+                            outcomes[:, ensemble_columns] = np.where(
+                                is_missing[itr][:, ensemble_columns], ensemble_outcomes[itr], NO_OUTCOME
+                            )
+                            results_log.append(alien_count, run_index, outcomes, constraint_ids, bot_ids)
+                            batch_outcomes[itr] = np.where(
+                                outcomes != NO_OUTCOME, outcomes, batch_outcomes[itr]
+                            )
+
+                    counts = count_outcomes(batch_outcomes, is_active)
+                    success_count += counts[0]
+                    survival_count += counts[1]
+                    failed_count += counts[2]
+                    run_count += counts[3]
+
+                    if adaptive:
+                        low, high = wilson_interval(success_count, run_count)
+                        is_active &= ((high - low) / 2 > SUCCESS_RATE_TOLERANCE) | (
+                            (success_count == 0) & (high > SUCCESS_RATE_TOLERANCE)
+                        )
+                        if not is_active.any():
+                            break
+
+                print(f'Roomba is soooo done with {alien_count} aliens, it will never visit them again!!!!')
+                success_rate, survival_rate = compute_rates(
+                    success_count, survival_count, failed_count, run_count
+                )
+                for itrc in range(total_constraints):
+                    for itrb in range(total_bots):
+                        if (success_rate[itrc][itrb] == 0) and (not alien_limit_set[itrc][itrb]):
+                            alien_count_limit[itrc][itrb] = alien_count
+                            alien_limit_set[itrc][itrb] = True
+                alien_count_set.append(alien_count)
+                success_rate_set[alien_count] = success_rate
+                survival_rate_set[alien_count] = survival_rate
+
+                low, high = wilson_interval(success_count, run_count)
+                max_half_width = max(max_half_width, np.max(high - low) / 2)
+                if (
+                    adaptive
+                    and np.all(success_count == 0)
+                    and np.all(high <= SUCCESS_RATE_TOLERANCE)
+                ):
+                    print(f'Every success rate has flatlined at {alien_count} aliens, skipping the rest of the sweep.')
+                    break
+    finally:
+        results_log.close()
 
-    while alien_count <= MAX_ALIEN_LIMIT:
-        success_count = np.zeros((total_constraints, total_bots))
-        survival_count = np.zeros((total_constraints, total_bots))
-        failed_count = np.zeros((total_constraints, total_bots))
-        success_rate = np.zeros((total_constraints, total_bots))
-        survival_rate = np.zeros((total_constraints, total_bots))
+    if profile_totals:
+        save_profile_totals(profile_totals, os.path.join(log_dir, 'profile.json'))
 
-        for itr in range(TOTAL_RUNS):
-            print('Roomba is trying to save for the %d\'th time. Imagine evading %d aliens.' % (itr, alien_count), end='\r')
-            ship = BonusShipV2(GRID_SIZE, alien_count)
-            ship.generate_grid()
-            ship.place_players()
+    generate_final_plot(success_rate_set, survival_rate_set, alien_count_set, constraint_levels, bot_nos)
+    # cells that kept a success up to the last alien count have no limit
+    print('K where bot get outperformed by aliens::: ', np.where(
+        alien_limit_set != 0, alien_count_limit.astype(int).astype(str), 'not reached'
+    ))
+    print(f'Success rates are within +-{max_half_width * 100:.1f}% at z={CONFIDENCE_Z}.')
+
+"""
+    Regenerates the final plots from the Results_Log under log_dir without
+    simulating anything, over every run recorded for each alien count.
+"""
 
-            constraints_set = constraints_factory(constraint_levels, ship)
-            for itrc, constraints in enumerate(constraints_set):
-                bots = bots_factory(bot_nos, ship, constraints)
-                for itrb, bot in enumerate(bots):
-                    status = execute_bot(bot, bot_nos[itrb], constraint_levels[itrc])
-                    if status == BOT_SUCCESS:
-                        success_count[itrc][itrb] += 1
-                    else:
-                        if status == BOT_STUCK:
-                            survival_count[itrc][itrb] += 1
-                        failed_count[itrc][itrb] += 1
-                del constraints
-
-            del ship
-        print(f'Roomba is soooo done with {alien_count} aliens, it will never visit them again!!!!')
-
-        for itrc in range(total_constraints):
-            for itrb in range(total_bots):
-                succeeded = success_count[itrc][itrb]
-                survived = survival_count[itrc][itrb]
-                failed = failed_count[itrc][itrb]
-
-                success_rate[itrc][itrb] = (succeeded / TOTAL_RUNS) * 100
-                # if both are 0, proceed to set survival_rate 0
-                if not (survived and failed):
-                    failed = 1
-                survival_rate[itrc][itrb] = survived / (survived + failed) * 100
-
-                if (success_rate[itrc][itrb] == 0) and (not alien_limit_set[itrc][itrb]):
-                    alien_count_limit[itrc][itrb] = alien_count
-                    alien_limit_set[itrc][itrb] = True
-        success_rate_set[alien_count] = success_rate
-        survival_rate_set[alien_count] = survival_rate
-        alien_count_set.append(alien_count)
-        alien_count += ALIEN_INC_COUNT
+def plot_results_log(bot_nos, constraint_levels, log_dir=RESULTS_LOG_DIR):
+    constraint_ids = [ALL_CONSTRAINTS.index(level) for level in constraint_levels]
+    bot_ids = [ALL_BOTS.index(bot_no) for bot_no in bot_nos]
+    results_log = Results_Log(log_dir)
+    results_log.close()
+
+    success_rate_set = {}
+    survival_rate_set = {}
+    alien_count_set = results_log.alien_counts()
+    for alien_count in alien_count_set:
+        outcomes = np.array([
+            results_log.get_outcomes(alien_count, itr, constraint_ids, bot_ids)
+            for itr in results_log.run_indices(alien_count)
+        ])
+        success_rate_set[alien_count], survival_rate_set[alien_count] = compute_rates(
+            *count_outcomes(outcomes, True)
+        )
 
     generate_final_plot(success_rate_set, survival_rate_set, alien_count_set, constraint_levels, bot_nos)
-    print('K where bot get outperformed by aliens::: ', alien_count_limit)
 
 """## MAIN"""
 
-print(f"Will the space roomba save the captain?")
-print(f"Let's start saving...")
-timer_start = time.process_time()
-bot_nos = ALL_BOTS # Could be array of bot in asc no like ['bot_1', 'bot_2']
-constraint_levels = ALL_CONSTRAINTS  # Array of constraint levels in asc like ['no_constraint', 'constraint_3']
+if __name__ == "__main__":
+    print(f"Will the space roomba save the captain?")
+    print(f"Let's start saving...")
+    timer_start = time.perf_counter()
+    bot_nos = ALL_BOTS # Could be array of bot in asc no like ['bot_1', 'bot_2']
+    constraint_levels = ALL_CONSTRAINTS  # Array of constraint levels in asc like ['no_constraint', 'constraint_3']
 
-run_simulations(bot_nos, constraint_levels)
+    run_simulations(bot_nos, constraint_levels)
 
-timer_end = time.process_time()
-timer_elapsed = timer_end - timer_start
-print(f"It took us {timer_elapsed} seconds to save idk how many times.")
-print("***cue the music*** But, I can still do this day ***cue the music***")
\ No newline at end of file
+    timer_end = time.perf_counter()
+    timer_elapsed = timer_end - timer_start
+    print(f"It took us {timer_elapsed} seconds to save idk how many times.")
+    print("***cue the music*** But, I can still do this day ***cue the music***")
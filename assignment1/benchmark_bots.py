@@ -0,0 +1,224 @@
+import ai_project_1
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tracemalloc
+from time import perf_counter_ns
+import numpy as np
+
+BENCHMARK_SEED = 0
+GRID_SIZES = [10, 30, 100, 300, 500]
+ALIEN_COUNTS = [1, 10, 40]
+TOTAL_RUNS = 3
+MAX_MOVES = 200 # caps each episode, so D=500 stays in minutes instead of hours
+REGRESSION_TOLERANCE = 0.25 # relative growth of a metric over the baseline that fails the run
+
+# metrics compared against the baseline, all of them lower is better
+RESULT_METRICS = ["latency_p50_us", "latency_p99_us", "nodes_expanded_per_move", "peak_memory_kb"]
+GENERATION_METRICS = ["generation_ms_p50", "generation_ms_p99"]
+
+def run_seed(grid_size, alien_count, run_index):
+    return int(
+        np.random.SeedSequence((BENCHMARK_SEED, grid_size, alien_count, run_index)).generate_state(1)[0]
+    )
+
+def seed_all(seed):
+    random.seed(seed)
+    np.random.seed(seed)
+
+"""
+    Returns the seeded ship of the run and the ns it took to generate, the
+    ship is None if it has no room for the bot, captain and aliens.
+"""
+
+def build_ship(grid_size, alien_count, run_index):
+    seed_all(run_seed(grid_size, alien_count, run_index))
+    timer_start = perf_counter_ns()
+    ship = ai_project_1.BonusShipV2(grid_size, alien_count)
+    ship.generate_grid()
+    if len(ship.open_cells) < alien_count + 1:
+        return None, 0
+    ship.place_players()
+    return ship, perf_counter_ns() - timer_start
+
+"""
+    Runs one bot episode on the ship and returns the latency of every move
+    in ns, from one is_stop_search check to the next, and the nodes its
+    searches expanded. The first move also holds the search Bot_1 does
+    before its loop. The bot is wrapped on the instance only, so the bots
+    of the sweep are untouched.
+"""
+
+def time_episode(bot):
+    move_stamps = []
+    is_stop_search = bot.is_stop_search
+
+    def timed_is_stop_search():
+        move_stamps.append(perf_counter_ns())
+        return is_stop_search()
+
+    bot.is_stop_search = timed_is_stop_search
+    move_stamps.append(perf_counter_ns())
+    bot.start_rescue()
+    move_stamps.append(perf_counter_ns())
+    return np.diff(move_stamps), bot.nodes_expanded
+
+def peak_episode_memory(ship, bot_no, constraints, seed):
+    seed_all(seed)
+    tracemalloc.start()
+    bot = ai_project_1.bots_factory([bot_no], ship, constraints)[0]
+    bot.start_rescue()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak_memory
+
+def run_benchmark(grid_sizes, alien_counts, bot_nos, constraint_levels, total_runs, is_memory):
+    results = []
+    generation = []
+    for grid_size in grid_sizes:
+        for alien_count in alien_counts:
+            # (bot, constraint): [ move latencies, nodes, moves, peak memory ]
+            cells = {
+                (bot_no, level): [[], 0, 0, 0]
+                for bot_no in bot_nos
+                for level in constraint_levels
+            }
+            generation_times = []
+            for run_index in range(total_runs):
+                ship, generation_time = build_ship(grid_size, alien_count, run_index)
+                if ship is None:
+                    break
+                generation_times.append(generation_time)
+                episode_seed = run_seed(grid_size, alien_count, run_index) + 1
+
+                constraints_set = ai_project_1.constraints_factory(constraint_levels, ship)
+                for level, constraints in zip(constraint_levels, constraints_set):
+                    for bot_no in bot_nos:
+                        cell = cells[(bot_no, level)]
+                        seed_all(episode_seed)
+                        bot = ai_project_1.bots_factory([bot_no], ship, constraints)[0]
+                        move_latencies, nodes_expanded = time_episode(bot)
+                        cell[0].extend(move_latencies.tolist())
+                        cell[1] += nodes_expanded
+                        cell[2] += len(move_latencies)
+                        if is_memory:
+                            cell[3] = max(cell[3], peak_episode_memory(ship, bot_no, constraints, episode_seed))
+                print(f"D={grid_size} K={alien_count} run {run_index} done", file=sys.stderr)
+
+            if not generation_times:
+                print(f"D={grid_size} cannot hold K={alien_count} aliens, skipped", file=sys.stderr)
+                continue
+
+            generation.append({
+                "grid_size": grid_size,
+                "alien_count": alien_count,
+                "generation_ms_p50": np.percentile(generation_times, 50) / 1e6,
+                "generation_ms_p99": np.percentile(generation_times, 99) / 1e6,
+            })
+            for (bot_no, level), (move_latencies, nodes_expanded, moves, peak_memory) in cells.items():
+                result = {
+                    "grid_size": grid_size,
+                    "alien_count": alien_count,
+                    "bot": bot_no,
+                    "constraint": level,
+                    "episodes": len(generation_times),
+                    "moves": moves,
+                    "latency_p50_us": np.percentile(move_latencies, 50) / 1e3,
+                    "latency_p99_us": np.percentile(move_latencies, 99) / 1e3,
+                    "nodes_expanded_per_move": nodes_expanded / max(moves, 1),
+                }
+                if is_memory:
+                    result["peak_memory_kb"] = peak_memory / 1024
+                results.append(result)
+    return {"results": results, "generation": generation}
+
+def result_key(result):
+    return tuple(result.get(name) for name in ("grid_size", "alien_count", "bot", "constraint"))
+
+"""
+    Returns every metric that grew by more than tolerance over the baseline,
+    for the entries both runs have.
+"""
+
+def compare_to_baseline(report, baseline, tolerance):
+    regressions = []
+    for section, metrics in (("results", RESULT_METRICS), ("generation", GENERATION_METRICS)):
+        baseline_entries = {result_key(entry): entry for entry in baseline.get(section, [])}
+        for entry in report[section]:
+            baseline_entry = baseline_entries.get(result_key(entry))
+            if baseline_entry is None:
+                continue
+            for metric in metrics:
+                if metric not in entry or not baseline_entry.get(metric):
+                    continue
+                ratio = entry[metric] / baseline_entry[metric]
+                if ratio > 1 + tolerance:
+                    regressions.append({
+                        "key": [value for value in result_key(entry) if value is not None],
+                        "metric": metric,
+                        "baseline": baseline_entry[metric],
+                        "current": entry[metric],
+                        "ratio": ratio,
+                    })
+    return regressions
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Per move latency, search and memory benchmark of the assignment1 bots.")
+    parser.add_argument("--grid-sizes", type=int, nargs="+", default=GRID_SIZES)
+    parser.add_argument("--alien-counts", type=int, nargs="+", default=ALIEN_COUNTS)
+    parser.add_argument("--bots", nargs="+", default=ai_project_1.ALL_BOTS, choices=ai_project_1.ALL_BOTS)
+    parser.add_argument("--constraints", nargs="+", default=ai_project_1.ALL_CONSTRAINTS, choices=ai_project_1.ALL_CONSTRAINTS)
+    parser.add_argument("--runs", type=int, default=TOTAL_RUNS, help="seeded ships per (D, K)")
+    parser.add_argument("--max-moves", type=int, default=MAX_MOVES, help="bot_max_moves of every constraint level")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass for peak memory")
+    parser.add_argument("--output", help="JSON report path, stdout by default")
+    parser.add_argument("--baseline", help="earlier JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    ai_project_1.DEFAULT_MAX_MOVES = args.max_moves
+    # bots_factory and constraints_factory build in ALL_BOTS and ALL_CONSTRAINTS order
+    bot_nos = [bot_no for bot_no in ai_project_1.ALL_BOTS if bot_no in args.bots]
+    constraint_levels = [level for level in ai_project_1.ALL_CONSTRAINTS if level in args.constraints]
+
+    report = run_benchmark(
+        args.grid_sizes, args.alien_counts, bot_nos, constraint_levels, args.runs, not args.no_memory
+    )
+    report["config"] = {
+        "grid_sizes": args.grid_sizes,
+        "alien_counts": args.alien_counts,
+        "bots": bot_nos,
+        "constraints": constraint_levels,
+        "runs": args.runs,
+        "max_moves": args.max_moves,
+        "seed": BENCHMARK_SEED,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare_to_baseline(report, json.load(baseline_file), args.tolerance)
+        report["regressions"] = regressions
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['key']} {regression['metric']}: "
+                f"{regression['baseline']:.3f} -> {regression['current']:.3f} ({regression['ratio']:.2f}x)",
+                file=sys.stderr,
+            )
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    sys.exit(1 if regressions else 0)